@@ -1,27 +1,23 @@
-from importlib import metadata
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from langchain_glean.chat_models import ChatGlean, ChatGleanAgent
-from langchain_glean.retrievers import (
-    GleanPeopleProfileRetriever,
-    GleanSearchRetriever,
-)
-from langchain_glean.toolkit import GleanToolkit
-from langchain_glean.tools import (
-    GleanChatTool,
-    GleanGetAgentSchemaTool,
-    GleanListAgentsTool,
-    GleanPeopleProfileSearchTool,
-    GleanRunAgentTool,
-    GleanSearchTool,
-)
-
-try:
-    __version__ = metadata.version(__package__)
-except metadata.PackageNotFoundError:
-    __version__ = ""
-del metadata
+if TYPE_CHECKING:
+    from langchain_glean.chat_models import ChatGlean, ChatGleanAgent
+    from langchain_glean.retrievers import (
+        GleanPeopleProfileRetriever,
+        GleanSearchRetriever,
+    )
+    from langchain_glean.toolkit import GleanToolkit
+    from langchain_glean.tools import (
+        GleanChatTool,
+        GleanGetAgentSchemaTool,
+        GleanListAgentsTool,
+        GleanPeopleProfileSearchTool,
+        GleanRunAgentTool,
+        GleanSearchTool,
+    )
 
-__all__ = [
+__all__ = (
     "ChatGlean",
     "ChatGleanAgent",
     "GleanSearchRetriever",
@@ -34,4 +30,46 @@ __all__ = [
     "GleanGetAgentSchemaTool",
     "GleanRunAgentTool",
     "__version__",
-]
+)
+
+# Public name -> owning submodule. Submodules pull in langchain_core and the
+# Glean SDK, so they are only imported when one of their symbols is accessed.
+_module_lookup = {
+    "ChatGlean": "langchain_glean.chat_models",
+    "ChatGleanAgent": "langchain_glean.chat_models",
+    "GleanSearchRetriever": "langchain_glean.retrievers",
+    "GleanPeopleProfileRetriever": "langchain_glean.retrievers",
+    "GleanSearchTool": "langchain_glean.tools",
+    "GleanPeopleProfileSearchTool": "langchain_glean.tools",
+    "GleanChatTool": "langchain_glean.tools",
+    "GleanToolkit": "langchain_glean.toolkit",
+    "GleanListAgentsTool": "langchain_glean.tools",
+    "GleanGetAgentSchemaTool": "langchain_glean.tools",
+    "GleanRunAgentTool": "langchain_glean.tools",
+}
+
+
+def _get_version() -> str:
+    from importlib import metadata
+
+    try:
+        return metadata.version(__package__ or __name__)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        version = globals()["__version__"] = _get_version()
+        return version
+    try:
+        module_name = _module_lookup[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
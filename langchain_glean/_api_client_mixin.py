@@ -1,9 +1,120 @@
+import asyncio
+import functools
 import os
-from typing import Any, Dict, Optional
+import threading
+import weakref
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from glean.api_client import Glean
-from langchain_core.utils import get_from_dict_or_env
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
+
+if TYPE_CHECKING:
+    import httpx
+    from glean.api_client import Glean
+    from glean.api_client.utils import RetryConfig
+
+
+def _get_from_env(key: str, env_key: str, default: Optional[str] = None) -> str:
+    """Return the ``env_key`` environment variable, falling back to ``default``.
+
+    Mirrors :func:`langchain_core.utils.get_from_env` but reads ``os.environ``
+    once instead of a membership test followed by a second fetch.
+    """
+    value = os.environ.get(env_key) or default
+    if value is None:
+        raise ValueError(f"Did not find {key}, please add an environment variable `{env_key}` which contains it, or pass `{key}` as a named parameter.")
+    return value
+
+
+# Connection-pool sizing for the SDK's httpx clients. httpx only keeps 20 idle
+# connections for 5s by default, so concurrent bursts above that (or calls more than
+# a few seconds apart) pay a fresh TCP + TLS handshake. The pool size can be
+# overridden per wrapper with ``pool_maxsize``.
+_MAX_CONNECTIONS = 100
+_KEEPALIVE_EXPIRY = 30.0
+
+# Exponential backoff used when retries are enabled: waits start at 0.5s and grow 1.5x per
+# attempt up to 30s, plus up to 1s of jitter. A Retry-After header takes precedence.
+_RETRY_INITIAL_INTERVAL_MS = 500
+_RETRY_MAX_INTERVAL_MS = 30_000
+_RETRY_EXPONENT = 1.5
+
+
+class _LoopLocalAsyncClient:
+    """Async HTTP client for the SDK that keeps one ``httpx.AsyncClient`` per event loop.
+
+    Pooled async connections belong to the loop that opened them, so a single
+    ``httpx.AsyncClient`` shared by a cached SDK client breaks as soon as a second loop
+    (e.g. a second ``asyncio.run``) reuses one of them. Each running loop therefore gets
+    its own client, created on first use; clients of closed loops are dropped.
+    """
+
+    def __init__(self, factory: Callable[[], "httpx.AsyncClient"]) -> None:
+        self._factory = factory
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            with self._lock:
+                # A client's pooled connections keep its loop alive, so closed loops are pruned here.
+                for closed in [other for other in self._clients if other.is_closed()]:
+                    del self._clients[closed]
+                client = self._clients.get(loop)
+                if client is None:
+                    client = self._clients[loop] = self._factory()
+        return client
+
+    async def send(self, request: Any, **kwargs: Any) -> Any:
+        return await self._client().send(request, **kwargs)
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> Any:
+        return self._client().build_request(method, url, **kwargs)
+
+    async def aclose(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+def _create_glean_client(
+    server_url: str,
+    instance: str,
+    api_token: str,
+    http2: bool = False,
+    pool_maxsize: int = _MAX_CONNECTIONS,
+) -> "Glean":
+    """Create a Glean SDK client using server_url (preferred) or instance.
+
+    ``http2=True`` multiplexes concurrent requests over a single connection and
+    requires the ``h2`` package (``pip install langchain-glean[http2]``).
+    """
+    # Imported here so the SDK is only loaded once a client is actually needed.
+    import httpx
+    from glean.api_client import Glean
+    from glean.api_client.httpclient import close_clients
+
+    limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize, keepalive_expiry=_KEEPALIVE_EXPIRY)
+    # Loading the CA bundle dominates client construction, so both clients share one SSL context.
+    ssl_context = httpx.create_ssl_context()
+    client = httpx.Client(follow_redirects=True, limits=limits, verify=ssl_context, http2=http2)
+    async_client = _LoopLocalAsyncClient(lambda: httpx.AsyncClient(follow_redirects=True, limits=limits, verify=ssl_context, http2=http2))
+
+    options: Dict[str, Any] = {"server_url": server_url} if server_url else {"instance": instance}
+    glean = Glean(api_token=api_token, client=client, async_client=async_client, **options)
+
+    # The SDK leaves caller-supplied clients open, so close ours once the SDK client is collected.
+    # Per-loop async clients cannot be closed from here; they are released with their loops.
+    weakref.finalize(glean, close_clients, glean.sdk_configuration, client, False, None, True)
+    return glean
+
+
+# One SDK client per backend/token pair, shared by every wrapper in the process: sync
+# requests share one httpx connection pool, async requests one pool per event loop.
+# ``act_as`` is sent per request as a header, so it is not part of the key.
+_shared_glean_client = functools.lru_cache(maxsize=16)(_create_glean_client)
 
 
 class GleanAPIClientMixin:  # noqa: D401
@@ -25,6 +136,30 @@ class GleanAPIClientMixin:  # noqa: D401
         default=None,
         description="Email to act as when using a global token. Ignored for user tokens.",
     )
+    pool_maxsize: int = Field(
+        default=_MAX_CONNECTIONS,
+        ge=1,
+        description="Maximum number of open (and idle keep-alive) connections to the Glean backend.",
+    )
+    max_retry_elapsed_ms: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Retry rate-limited (429), 5xx and connection-failed search and people requests with exponential backoff, "
+        "honouring Retry-After, for up to this many milliseconds. Chat and agent runs are never retried. Disabled by default.",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with the Glean backend. Requires the 'h2' package (pip install langchain-glean[http2]).",
+    )
+
+    @field_validator("http2")
+    @classmethod
+    def _require_h2(cls, value: bool) -> bool:
+        # Fail at construction: httpx only raises once a client is built, where the wrappers'
+        # error handling would turn it into empty results.
+        if value and find_spec("h2") is None:
+            raise ImportError('http2=True requires the "h2" package. Install it with pip install "httpx[http2]" (or "langchain-glean[http2]").')
+        return value
 
     @model_validator(mode="before")
     @classmethod
@@ -32,17 +167,40 @@ class GleanAPIClientMixin:  # noqa: D401
         values = values or {}
         if not values.get("server_url"):
             values["server_url"] = os.environ.get("GLEAN_SERVER_URL", "")
-        if not values.get("server_url") and not values.get("instance"):
-            values["instance"] = get_from_dict_or_env(values, "instance", "GLEAN_INSTANCE")
-        values["api_token"] = get_from_dict_or_env(values, "api_token", "GLEAN_API_TOKEN")
-        values["act_as"] = get_from_dict_or_env(values, "act_as", "GLEAN_ACT_AS", default="")
+        if not values["server_url"] and not values.get("instance"):
+            values["instance"] = _get_from_env("instance", "GLEAN_INSTANCE")
+        if not values.get("api_token"):
+            values["api_token"] = _get_from_env("api_token", "GLEAN_API_TOKEN")
+        # An explicit act_as="" means "don't impersonate", so only fall back when it was not passed.
+        if values.get("act_as") is None:
+            values["act_as"] = _get_from_env("act_as", "GLEAN_ACT_AS", default="")
         return values
 
-    def _build_glean_client(self) -> Glean:
-        """Create a Glean SDK client using server_url (preferred) or instance."""
-        if self.server_url:
-            return Glean(server_url=self.server_url, api_token=self.api_token)
-        return Glean(instance=self.instance, api_token=self.api_token)
+    def _build_glean_client(self) -> "Glean":
+        """Create a new Glean SDK client using server_url (preferred) or instance."""
+        return _create_glean_client(self.server_url or "", self.instance, self.api_token, self.http2, self.pool_maxsize)
+
+    def _get_glean_client(self) -> "Glean":
+        """Return the process-wide Glean SDK client for this backend and token.
+
+        Unlike :meth:`_build_glean_client` the client is not closed after use, so its
+        keep-alive connections are reused by every wrapper sharing the same credentials
+        (async connections only within the event loop that opened them).
+        """
+        return _shared_glean_client(self.server_url or "", self.instance, self.api_token, self.http2, self.pool_maxsize)
+
+    def _retry_config(self) -> "Optional[RetryConfig]":
+        """Return the backoff policy for read-only calls, or ``None`` when retries are disabled.
+
+        Passed per request rather than set on the shared SDK client, so non-idempotent
+        calls such as ``chat.create`` and ``agents.run`` are never replayed.
+        """
+        if not self.max_retry_elapsed_ms:
+            return None
+        from glean.api_client.utils import BackoffStrategy, RetryConfig
+
+        backoff = BackoffStrategy(_RETRY_INITIAL_INTERVAL_MS, _RETRY_MAX_INTERVAL_MS, _RETRY_EXPONENT, self.max_retry_elapsed_ms)
+        return RetryConfig("backoff", backoff, retry_connection_errors=True)
 
     def _http_headers(self) -> Optional[Dict[str, str]]:
         """Return HTTP headers for impersonation if ``act_as`` is set."""
@@ -1,6 +1,32 @@
 """LangChain Chat Models for Glean."""
 
-from langchain_glean.chat_models.agent_chat import ChatGleanAgent
-from langchain_glean.chat_models.chat import ChatBasicRequest, ChatGlean
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["ChatGlean", "ChatBasicRequest", "ChatGleanAgent"]
+if TYPE_CHECKING:
+    from langchain_glean.chat_models.agent_chat import ChatGleanAgent
+    from langchain_glean.chat_models.chat import ChatBasicRequest, ChatGlean
+
+__all__ = ("ChatGlean", "ChatBasicRequest", "ChatGleanAgent")
+
+# ``chat`` needs the Glean SDK models at import time while ``agent_chat`` does not,
+# so each submodule is only imported when one of its symbols is accessed.
+_module_lookup = {
+    "ChatGlean": "langchain_glean.chat_models.chat",
+    "ChatBasicRequest": "langchain_glean.chat_models.chat",
+    "ChatGleanAgent": "langchain_glean.chat_models.agent_chat",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _module_lookup[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
@@ -0,0 +1,13 @@
+from typing import Any, Dict, List, Union
+
+
+def _content_to_text(content: Union[str, List[Union[str, Dict[str, Any]]]]) -> str:
+    """Return the plain text of a LangChain message ``content``.
+
+    String content is returned as-is; for multi-part content the text of string
+    parts and ``{"type": "text"}`` blocks is concatenated and other blocks
+    (images, tool calls, ...) are skipped.
+    """
+    if isinstance(content, str):
+        return content
+    return "".join(part if isinstance(part, str) else part.get("text", "") for part in content if isinstance(part, str) or part.get("type") == "text")
@@ -1,6 +1,5 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional
 
-from glean.api_client import errors, models
 from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
@@ -8,21 +7,35 @@ from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import ConfigDict, Field
 
 from langchain_glean._api_client_mixin import GleanAPIClientMixin
+from langchain_glean.chat_models._utils import _content_to_text
+
+# ``models.Author`` is a ``str`` enum, so this compares equal to both raw dict payloads and SDK models.
+_GLEAN_AI = "GLEAN_AI"
 
 
 class ChatGleanAgent(GleanAPIClientMixin, BaseChatModel):
     """LangChain ChatModel wrapper for running a specific Glean Agent."""
 
     agent_id: str = Field(description="ID of the agent to run")
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore")
 
     @property
     def _llm_type(self) -> str:
         return "glean-agent-chat"
 
     def _extract_user_input(self, messages: List[BaseMessage]) -> str:
-        user_messages = [str(m.content) for m in messages if isinstance(m, HumanMessage)]
-        return "\n".join(user_messages).strip()
+        return "\n".join(_content_to_text(m.content) for m in messages if isinstance(m, HumanMessage)).strip()
+
+    def _build_fields(self, messages: List[BaseMessage], kwargs: Dict[str, Any]) -> Dict[str, str]:
+        """Pop caller-supplied ``fields`` from ``kwargs`` and default ``input`` to the user's messages."""
+        fields: Dict[str, str] = kwargs.pop("fields", None) or {}
+        if "input" in fields:
+            return fields
+        user_input = self._extract_user_input(messages)
+        if user_input:
+            # Copy rather than mutate the caller's mapping.
+            fields = {**fields, "input": user_input}
+        return fields
 
     def _generate(
         self,
@@ -34,52 +47,21 @@ class ChatGleanAgent(GleanAPIClientMixin, BaseChatModel):
         if stop is not None:
             raise ValueError("stop sequences are not supported by AgentChatModel")
 
-        fields: Dict[str, str] = cast(Dict[str, str], kwargs.pop("fields", {}))
-        user_input = self._extract_user_input(messages)
-        if user_input and "input" not in fields:
-            fields["input"] = user_input
+        import httpx
+        from glean.api_client import errors
+
+        fields = self._build_fields(messages, kwargs)
 
         try:
-            with self._build_glean_client() as g:
-                response = g.client.agents.run(agent_id=self.agent_id, input=fields)
+            response = self._get_glean_client().client.agents.run(agent_id=self.agent_id, input=fields)
         except errors.GleanError as e:
             raise ValueError(f"Glean client error: {e}") from e
-        except Exception:
+        except httpx.TransportError:
+            # Only connection-level failures (timeouts, refused or dropped connections) degrade to a placeholder.
             fallback = AIMessage(content="(offline) Unable to reach Glean – returning placeholder response.")
             return ChatResult(generations=[ChatGeneration(message=fallback)])
 
-        content = ""
-        if hasattr(response, "messages") and response.messages:
-            ai_messages = []
-
-            for msg in response.messages:
-                if isinstance(msg, dict) and msg.get("author") == "GLEAN_AI":
-                    author = models.Author.GLEAN_AI
-
-                    fragments = []
-                    for frag in msg.get("fragments", []):
-                        if isinstance(frag, dict) and "text" in frag:
-                            fragments.append(models.ChatMessageFragment(text=frag.get("text", "")))
-
-                    chat_message = models.ChatMessage(author=author, message_type=models.MessageType.CONTENT, fragments=fragments)
-
-                    ai_messages.append(chat_message)
-                elif hasattr(msg, "author") and msg.author == models.Author.GLEAN_AI:
-                    ai_messages.append(msg)
-
-            if ai_messages:
-                last_message = ai_messages[-1]
-
-                if hasattr(last_message, "fragments") and last_message.fragments:
-                    for fragment in last_message.fragments:
-                        if fragment.text:
-                            content += fragment.text
-
-        if not content:
-            content = str(response)
-
-        generation = ChatGeneration(message=AIMessage(content=content))
-        return ChatResult(generations=[generation])
+        return self._response_to_chat_result(response)
 
     async def _agenerate(
         self,
@@ -91,46 +73,41 @@ class ChatGleanAgent(GleanAPIClientMixin, BaseChatModel):
         if stop is not None:
             raise ValueError("stop sequences are not supported by AgentChatModel")
 
-        fields: Dict[str, str] = cast(Dict[str, str], kwargs.pop("fields", {}))
-        user_input = self._extract_user_input(messages)
-        if user_input and "input" not in fields:
-            fields["input"] = user_input
+        import httpx
+        from glean.api_client import errors
+
+        fields = self._build_fields(messages, kwargs)
 
         try:
-            with self._build_glean_client() as g:
-                response = await g.client.agents.run_async(agent_id=self.agent_id, input=fields)
+            response = await self._get_glean_client().client.agents.run_async(agent_id=self.agent_id, input=fields)
         except errors.GleanError as e:
             raise ValueError(f"Glean client error: {e}") from e
-        except Exception:
+        except httpx.TransportError:
+            # Only connection-level failures (timeouts, refused or dropped connections) degrade to a placeholder.
             fallback = AIMessage(content="(offline) Unable to reach Glean – returning placeholder response.")
             return ChatResult(generations=[ChatGeneration(message=fallback)])
 
-        content = ""
-        if hasattr(response, "messages") and response.messages:
-            ai_messages = []
+        return self._response_to_chat_result(response)
 
-            for msg in response.messages:
-                if isinstance(msg, dict) and msg.get("author") == "GLEAN_AI":
-                    author = models.Author.GLEAN_AI
-
-                    fragments = []
-                    for frag in msg.get("fragments", []):
-                        if isinstance(frag, dict) and "text" in frag:
-                            fragments.append(models.ChatMessageFragment(text=frag.get("text", "")))
-
-                    chat_message = models.ChatMessage(author=author, message_type=models.MessageType.CONTENT, fragments=fragments)
-
-                    ai_messages.append(chat_message)
-                elif hasattr(msg, "author") and msg.author == models.Author.GLEAN_AI:
-                    ai_messages.append(msg)
-
-            if ai_messages:
-                last_message = ai_messages[-1]
-
-                if hasattr(last_message, "fragments") and last_message.fragments:
-                    for fragment in last_message.fragments:
-                        if fragment.text:
-                            content += fragment.text
+    @staticmethod
+    def _response_to_chat_result(response: Any) -> ChatResult:
+        """Convert an agent run response into a ``ChatResult`` holding the last Glean AI message."""
+        content = ""
+        response_messages = getattr(response, "messages", None)
+        if response_messages:
+            # Only the most recent Glean AI message is used, so scan from the end and stop at the first match.
+            for msg in reversed(response_messages):
+                if isinstance(msg, dict):
+                    if msg.get("author") != _GLEAN_AI:
+                        continue
+                    texts = (frag.get("text") for frag in msg.get("fragments", []) if isinstance(frag, dict))
+                elif getattr(msg, "author", None) == _GLEAN_AI:
+                    texts = (fragment.text for fragment in getattr(msg, "fragments", None) or [])
+                else:
+                    continue
+
+                content = "".join(text for text in texts if text)
+                break
 
         if not content:
             content = str(response)
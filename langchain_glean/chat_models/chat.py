@@ -1,6 +1,9 @@
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union, cast
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union, cast
 
-from glean.api_client import errors, models
+from glean.api_client import Glean, errors, models
 from langchain_core.callbacks import (
     AsyncCallbackManagerForLLMRun,
     CallbackManagerForLLMRun,
@@ -18,6 +21,21 @@ from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResu
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from langchain_glean._api_client_mixin import GleanAPIClientMixin
+from langchain_glean.chat_models._utils import _content_to_text
+
+# LangChain message class -> (Glean author, Glean message type). System prompts are sent as user-authored context.
+_MESSAGE_AUTHORS = {
+    HumanMessage: (models.Author.USER, models.MessageType.CONTENT),
+    AIMessage: (models.Author.GLEAN_AI, models.MessageType.CONTENT),
+    SystemMessage: (models.Author.USER, models.MessageType.CONTEXT),
+}
+
+# Upper-cased ``ChatMessage.role`` -> Glean author; unknown roles are treated as the user.
+_ROLE_AUTHORS = {
+    "USER": models.Author.USER,
+    "ASSISTANT": models.Author.GLEAN_AI,
+    "AI": models.Author.GLEAN_AI,
+}
 
 
 class ChatBasicRequest(BaseModel):
@@ -56,6 +74,13 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         (Deprecated) Glean instance / sub-domain (``GLEAN_INSTANCE``). Use server_url instead.
     act_as : str, optional
         Email to impersonate when using a global token (``GLEAN_ACT_AS``).
+    stream_batch_size : int, optional
+        Merge this many streamed text fragments into each chunk yielded by
+        :py:meth:`stream` / :py:meth:`astream`, cutting per-chunk callback overhead on long
+        responses. Defaults to ``1`` (one chunk per fragment).
+    prewarm : bool, optional
+        Open a connection to the Glean backend in a background thread on construction so
+        the first request does not pay the TCP/TLS handshake. Defaults to ``False``.
     chat_id : str, optional
         Continue an existing chat session or inspect the ID after the first call via the :pyattr:`chat_id` property.
     model_kwargs : Dict[str, Any]
@@ -89,9 +114,44 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         print(response.content)
     """
 
+    prewarm: bool = Field(
+        default=False,
+        description="Open a connection to the Glean backend in a background thread on construction.",
+    )
+
+    stream_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Number of streamed text fragments to merge into each yielded chunk.",
+    )
+
     _chat_id: Optional[str] = PrivateAttr(default=None)
+    # ``(agent, mode)`` -> ``AgentConfig`` built from dict overrides, reused across calls.
+    _agent_configs: Dict[Tuple[str, str], models.AgentConfig] = PrivateAttr(default_factory=dict)
     model_config = ConfigDict(extra="allow")
 
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        if self.prewarm:
+            # Resolve the shared client here: the cache does not serialise concurrent misses, so
+            # building it on the thread could race the caller and warm a pool that is never used.
+            threading.Thread(target=self._prewarm, args=(self._get_glean_client(),), daemon=True).start()
+
+    def _prewarm(self, glean: Glean) -> None:
+        """Issue a ``HEAD`` to the backend so ``glean``'s pool holds a warm connection."""
+        import httpx
+        from glean.api_client.utils import template_url
+
+        sdk_configuration = glean.sdk_configuration
+        client = sdk_configuration.client
+        if client is None:
+            return
+        try:
+            client.send(client.build_request("HEAD", template_url(*sdk_configuration.get_server_details())))
+        except httpx.HTTPError:
+            # Best effort only: the first real request reports any connectivity problem.
+            pass
+
     @property
     def chat_id(self) -> Optional[str]:  # noqa: D401
         """ID of the current chat session.
@@ -124,24 +184,17 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         Returns:
             The message in Glean's format.
         """
-        if isinstance(message, HumanMessage):
-            author = models.Author.USER
-        elif isinstance(message, AIMessage):
-            author = models.Author.GLEAN_AI
-        elif isinstance(message, SystemMessage):
-            author = models.Author.USER
-            return models.ChatMessage(author=author, message_type=models.MessageType.CONTEXT, fragments=[models.ChatMessageFragment(text=str(message.content))])
-        elif isinstance(message, ChatMessage):
-            if message.role.upper() == "USER":
-                author = models.Author.USER
-            elif message.role.upper() == "ASSISTANT" or message.role.upper() == "AI":
-                author = models.Author.GLEAN_AI
-            else:
-                author = models.Author.USER
+        if isinstance(message, ChatMessage):
+            author = _ROLE_AUTHORS.get(message.role.upper(), models.Author.USER)
+            message_type = models.MessageType.CONTENT
         else:
-            author = models.Author.USER
+            # Walk the MRO so subclasses such as ``AIMessageChunk`` resolve like their base; exact types hit first.
+            author, message_type = next(
+                (_MESSAGE_AUTHORS[cls] for cls in type(message).__mro__ if cls in _MESSAGE_AUTHORS),
+                (models.Author.USER, models.MessageType.CONTENT),
+            )
 
-        return models.ChatMessage(author=author, message_type=models.MessageType.CONTENT, fragments=[models.ChatMessageFragment(text=str(message.content))])
+        return models.ChatMessage(author=author, message_type=message_type, fragments=[models.ChatMessageFragment(text=_content_to_text(message.content))])
 
     def _convert_glean_message_to_langchain(self, message: models.ChatMessage) -> BaseMessage:
         """Convert a Glean message to a LangChain message.
@@ -152,11 +205,7 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         Returns:
             The message in LangChain's format.
         """
-        content = ""
-        if message.fragments:
-            for fragment in message.fragments:
-                if fragment.text:
-                    content += fragment.text
+        content = "".join(fragment.text for fragment in message.fragments or [] if fragment.text)
 
         if message.author == models.Author.GLEAN_AI:
             return AIMessage(content=content)
@@ -176,46 +225,44 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         glean_messages = [self._convert_message_to_glean_format(msg) for msg in messages]
 
         agent_config_arg = overrides.get("agent_config")
-        if agent_config_arg is None:
-            agent_config_arg = {"agent": "DEFAULT", "mode": "DEFAULT"}
-
-        agent_config: Optional[models.AgentConfig] = None
-        if agent_config_arg is not None:
-            if isinstance(agent_config_arg, dict):
-                agent_config = models.AgentConfig(agent=agent_config_arg.get("agent", "DEFAULT"), mode=agent_config_arg.get("mode", "DEFAULT"))
-            else:
-                agent_config = agent_config_arg  # type: ignore[assignment]
-
-        save_chat_flag = bool(overrides.get("save_chat", False))
-
-        request = models.ChatRequest(messages=glean_messages, save_chat=save_chat_flag, agent_config=agent_config)
-
-        chat_id_val = overrides.get("chat_id", self._chat_id)
-        if chat_id_val:
-            request.chat_id = chat_id_val
-
-        inclusions_val = overrides.get("inclusions")
-        exclusions_val = overrides.get("exclusions")
-
-        if inclusions_val is not None:
-            if isinstance(inclusions_val, dict):
-                inclusions_val = models.ChatRestrictionFilters(**inclusions_val)
-            request.inclusions = inclusions_val  # type: ignore[assignment]
-
-        if exclusions_val is not None:
-            if isinstance(exclusions_val, dict):
-                exclusions_val = models.ChatRestrictionFilters(**exclusions_val)
-            request.exclusions = exclusions_val  # type: ignore[assignment]
-
-        timeout_ms_val = overrides.get("timeout_millis")
-        if timeout_ms_val is not None:
-            request.timeout_millis = timeout_ms_val
-
-        app_id_val = overrides.get("application_id")
-        if app_id_val is not None:
-            request.application_id = app_id_val
+        if agent_config_arg is None or isinstance(agent_config_arg, dict):
+            agent_config = self._agent_config_from_dict(agent_config_arg or {})
+        else:
+            agent_config = agent_config_arg
+
+        # Build the request in one validated call; dict filters are coerced to ChatRestrictionFilters by pydantic.
+        return models.ChatRequest(
+            messages=glean_messages,
+            save_chat=bool(overrides.get("save_chat", False)),
+            agent_config=agent_config,
+            chat_id=overrides.get("chat_id", self._chat_id) or None,
+            inclusions=overrides.get("inclusions"),
+            exclusions=overrides.get("exclusions"),
+            timeout_millis=overrides.get("timeout_millis"),
+            application_id=overrides.get("application_id"),
+        )
 
-        return request
+    def _chat_call_kwargs(self, params: models.ChatRequest) -> Dict[str, Any]:
+        """Return the keyword arguments for the SDK ``chat.create*`` calls."""
+        return {
+            "messages": params.messages,
+            "save_chat": params.save_chat,
+            "chat_id": params.chat_id,
+            "agent_config": params.agent_config,
+            "inclusions": params.inclusions,
+            "exclusions": params.exclusions,
+            "timeout_millis": params.timeout_millis,
+            "application_id": params.application_id,
+            "http_headers": self._http_headers(),
+        }
+
+    def _agent_config_from_dict(self, config: Dict[str, Any]) -> models.AgentConfig:
+        """Return the ``AgentConfig`` for *config*, building it only on first use."""
+        key = (config.get("agent", "DEFAULT"), config.get("mode", "DEFAULT"))
+        agent_config = self._agent_configs.get(key)
+        if agent_config is None:
+            agent_config = self._agent_configs[key] = models.AgentConfig(agent=key[0], mode=key[1])
+        return agent_config
 
     def _messages_from_chat_input(self, chat_input: ChatBasicRequest) -> List[BaseMessage]:
         """Convert a ChatBasicRequest to a list of messages.
@@ -271,19 +318,7 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
             params = self._build_chat_params(cast(List[BaseMessage], messages), **kwargs)
 
         try:
-            with self._build_glean_client() as g:
-                headers = self._http_headers()
-                response = g.client.chat.create(
-                    messages=params.messages,
-                    save_chat=params.save_chat,
-                    chat_id=params.chat_id if hasattr(params, "chat_id") else None,
-                    agent_config=params.agent_config,
-                    inclusions=params.inclusions,
-                    exclusions=params.exclusions,
-                    timeout_millis=params.timeout_millis if hasattr(params, "timeout_millis") else None,
-                    application_id=params.application_id if hasattr(params, "application_id") else None,
-                    http_headers=headers,
-                )
+            response = self._get_glean_client().client.chat.create(**self._chat_call_kwargs(params))
 
         except errors.GleanError as client_err:
             raise ValueError(f"Glean client error: {str(client_err)}")
@@ -291,41 +326,46 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
             fallback_message = AIMessage(content="(offline) Unable to reach Glean – returning placeholder response.")
             return ChatResult(generations=[ChatGeneration(message=fallback_message)])
 
-        ai_messages = []
-        if response and hasattr(response, "messages"):
-            for msg in response.messages:
-                if isinstance(msg, dict):
-                    author = models.Author.GLEAN_AI if msg.get("author") == "GLEAN_AI" else models.Author.USER
-                    message_type = models.MessageType.CONTENT if msg.get("messageType") == "CONTENT" else models.MessageType.CONTEXT
+        return self._finalize_response(response)
 
-                    fragments = []
-                    for frag in msg.get("fragments", []):
-                        if isinstance(frag, dict) and "text" in frag:
-                            fragments.append(models.ChatMessageFragment(text=frag.get("text", "")))
+    def _finalize_response(self, response: Any) -> ChatResult:
+        """Turn a Glean chat response into a ``ChatResult`` and remember its chat ID.
 
-                    chat_message = models.ChatMessage(author=author, message_type=message_type, fragments=fragments)
+        Args:
+            response: The response returned by the Glean chat API.
 
-                    if author == models.Author.GLEAN_AI and message_type == models.MessageType.CONTENT:
-                        ai_messages.append(chat_message)
-                else:
-                    if msg.author == models.Author.GLEAN_AI and msg.message_type == models.MessageType.CONTENT:
-                        ai_messages.append(msg)
+        Returns:
+            A ChatResult wrapping the last AI content message of the response.
 
-        if not ai_messages:
+        Raises:
+            ValueError: If the response contains no AI content message.
+        """
+        ai_message: Optional[models.ChatMessage] = None
+        # The answer is the last AI content message, so scan from the end and stop at the first hit.
+        for msg in reversed(getattr(response, "messages", None) or []):
+            if isinstance(msg, dict):
+                if msg.get("author") == "GLEAN_AI" and msg.get("messageType") == "CONTENT":
+                    fragments = [
+                        models.ChatMessageFragment(text=frag.get("text", "")) for frag in msg.get("fragments", []) if isinstance(frag, dict) and "text" in frag
+                    ]
+                    ai_message = models.ChatMessage(author=models.Author.GLEAN_AI, message_type=models.MessageType.CONTENT, fragments=fragments)
+                    break
+            elif msg.author == models.Author.GLEAN_AI and msg.message_type == models.MessageType.CONTENT:
+                ai_message = msg
+                break
+
+        if ai_message is None:
             raise ValueError("No AI response found in the Glean response")
 
-        ai_message = ai_messages[-1]
-
-        if hasattr(response, "chatId") and response.chatId:
-            self._chat_id = response.chatId
-
-        langchain_message = self._convert_glean_message_to_langchain(ai_message)
+        chat_id = getattr(response, "chatId", None)
+        if chat_id:
+            self._chat_id = chat_id
 
         generation = ChatGeneration(
-            message=langchain_message,
+            message=self._convert_glean_message_to_langchain(ai_message),
             generation_info={
                 "chat_id": self._chat_id,
-                "tracking_token": response.chatSessionTrackingToken if hasattr(response, "chatSessionTrackingToken") else None,
+                "tracking_token": getattr(response, "chatSessionTrackingToken", None),
             },
         )
 
@@ -364,19 +404,7 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
             params = self._build_chat_params(cast(List[BaseMessage], messages), **kwargs)
 
         try:
-            with self._build_glean_client() as g:
-                headers = self._http_headers()
-                response = await g.client.chat.create_async(
-                    messages=params.messages,
-                    save_chat=params.save_chat,
-                    chat_id=params.chat_id if hasattr(params, "chat_id") else None,
-                    agent_config=params.agent_config,
-                    inclusions=params.inclusions,
-                    exclusions=params.exclusions,
-                    timeout_millis=params.timeout_millis if hasattr(params, "timeout_millis") else None,
-                    application_id=params.application_id if hasattr(params, "application_id") else None,
-                    http_headers=headers,
-                )
+            response = await self._get_glean_client().client.chat.create_async(**self._chat_call_kwargs(params))
 
         except errors.GleanError as client_err:
             raise ValueError(f"Glean client error: {str(client_err)}")
@@ -384,46 +412,41 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
             fallback_message = AIMessage(content="(offline) Unable to reach Glean – returning placeholder response.")
             return ChatResult(generations=[ChatGeneration(message=fallback_message)])
 
-        ai_messages = []
-        if response and hasattr(response, "messages"):
-            for msg in response.messages:
-                if isinstance(msg, dict):
-                    author = models.Author.GLEAN_AI if msg.get("author") == "GLEAN_AI" else models.Author.USER
-                    message_type = models.MessageType.CONTENT if msg.get("messageType") == "CONTENT" else models.MessageType.CONTEXT
-
-                    fragments = []
-                    for frag in msg.get("fragments", []):
-                        if isinstance(frag, dict) and "text" in frag:
-                            fragments.append(models.ChatMessageFragment(text=frag.get("text", "")))
-
-                    chat_message = models.ChatMessage(author=author, message_type=message_type, fragments=fragments)
-
-                    if author == models.Author.GLEAN_AI and message_type == models.MessageType.CONTENT:
-                        ai_messages.append(chat_message)
-                else:
-                    # It's already a ChatMessage
-                    if msg.author == models.Author.GLEAN_AI and msg.message_type == models.MessageType.CONTENT:
-                        ai_messages.append(msg)
-
-        if not ai_messages:
-            raise ValueError("No AI response found in the Glean response")
-
-        ai_message = ai_messages[-1]
+        return self._finalize_response(response)
 
-        if hasattr(response, "chatId") and response.chatId:
-            self._chat_id = response.chatId
+    def _parse_stream_line(self, line: str) -> Iterator[ChatGenerationChunk]:
+        """Yield a chunk for each Glean AI text fragment in one JSON line of a streamed response.
 
-        langchain_message = self._convert_glean_message_to_langchain(ai_message)
+        Args:
+            line: A single newline-delimited ``ChatResponse`` JSON document.
 
-        generation = ChatGeneration(
-            message=langchain_message,
-            generation_info={
-                "chat_id": self._chat_id,
-                "tracking_token": response.chatSessionTrackingToken if hasattr(response, "chatSessionTrackingToken") else None,
-            },
-        )
+        Yields:
+            ChatGenerationChunk: One chunk per non-empty content fragment.
+        """
+        chunk_data = json.loads(line)
+        if "messages" not in chunk_data:
+            return
 
-        return ChatResult(generations=[generation])
+        chat_id = chunk_data.get("chatId")
+        if chat_id and not self._chat_id:
+            self._chat_id = chat_id
+        tracking_token = chunk_data.get("chatSessionTrackingToken")
+
+        for message in chunk_data["messages"]:
+            if isinstance(message, dict) and message.get("author") == "GLEAN_AI" and message.get("messageType") == "CONTENT":
+                for fragment in message.get("fragments", []):
+                    new_content = fragment.get("text")
+                    if new_content:
+                        yield ChatGenerationChunk(
+                            message=AIMessageChunk(content=new_content), generation_info={"chat_id": chat_id, "tracking_token": tracking_token}
+                        )
+
+    @staticmethod
+    def _merge_stream_chunks(chunks: List[ChatGenerationChunk]) -> ChatGenerationChunk:
+        """Merge buffered stream chunks into one, keeping the latest generation info."""
+        if len(chunks) == 1:
+            return chunks[0]
+        return ChatGenerationChunk(message=AIMessageChunk(content="".join(chunk.text for chunk in chunks)), generation_info=chunks[-1].generation_info)
 
     def _stream(
         self,
@@ -459,56 +482,37 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         params.stream = True
 
         try:
-            with self._build_glean_client() as g:
-                headers = self._http_headers()
-                response_stream = g.client.chat.create_stream(
-                    messages=params.messages,
-                    save_chat=params.save_chat,
-                    chat_id=params.chat_id if hasattr(params, "chat_id") else None,
-                    agent_config=params.agent_config,
-                    inclusions=params.inclusions,
-                    exclusions=params.exclusions,
-                    timeout_millis=params.timeout_millis if hasattr(params, "timeout_millis") else None,
-                    application_id=params.application_id if hasattr(params, "application_id") else None,
-                    stream=True,
-                    http_headers=headers,
-                )
+            response_stream = self._get_glean_client().client.chat.create_stream(**self._chat_call_kwargs(params), stream=True)
 
+            pending: List[ChatGenerationChunk] = []
+            # The SDK returns the complete body as one str, so split that str directly instead of copying it into a buffer.
             for line in response_stream.splitlines():
                 if not line.strip():
                     continue
 
                 try:
-                    import json
-
-                    chunk_data = json.loads(line)
-                    if "messages" in chunk_data:
-                        for message in chunk_data["messages"]:
-                            if isinstance(message, dict) and message.get("author") == "GLEAN_AI" and message.get("messageType") == "CONTENT":
-                                for fragment in message.get("fragments", []):
-                                    if "text" in fragment:
-                                        new_content = fragment.get("text", "")
-                                        if new_content:
-                                            message_chunk = AIMessageChunk(content=new_content)
-
-                                            chat_id = chunk_data.get("chatId")
-                                            if chat_id and not self._chat_id:
-                                                self._chat_id = chat_id
-
-                                            tracking_token = chunk_data.get("chatSessionTrackingToken")
-
-                                            gen_chunk = ChatGenerationChunk(
-                                                message=message_chunk, generation_info={"chat_id": chat_id, "tracking_token": tracking_token}
-                                            )
-                                            yield gen_chunk
-
-                                            if run_manager:
-                                                run_manager.on_llm_new_token(new_content)
+                    for gen_chunk in self._parse_stream_line(line):
+                        pending.append(gen_chunk)
+                        if len(pending) < self.stream_batch_size:
+                            continue
+                        gen_chunk = self._merge_stream_chunks(pending)
+                        pending = []
+                        yield gen_chunk
+
+                        if run_manager:
+                            run_manager.on_llm_new_token(gen_chunk.text)
                 except Exception as parsing_error:
                     if run_manager:
                         run_manager.on_llm_error(parsing_error)
                     raise ValueError(f"Error parsing stream response: {str(parsing_error)}")
 
+            if pending:
+                gen_chunk = self._merge_stream_chunks(pending)
+                yield gen_chunk
+
+                if run_manager:
+                    run_manager.on_llm_new_token(gen_chunk.text)
+
         except errors.GleanError as client_err:
             if run_manager:
                 run_manager.on_llm_error(client_err)
@@ -552,56 +556,41 @@ class ChatGlean(GleanAPIClientMixin, BaseChatModel):
         params.stream = True
 
         try:
-            with self._build_glean_client() as g:
-                headers = self._http_headers()
-                response_stream = await g.client.chat.create_stream_async(
-                    messages=params.messages,
-                    save_chat=params.save_chat,
-                    chat_id=params.chat_id if hasattr(params, "chat_id") else None,
-                    agent_config=params.agent_config,
-                    inclusions=params.inclusions,
-                    exclusions=params.exclusions,
-                    timeout_millis=params.timeout_millis if hasattr(params, "timeout_millis") else None,
-                    application_id=params.application_id if hasattr(params, "application_id") else None,
-                    stream=True,
-                    http_headers=headers,
-                )
+            response_stream = await self._get_glean_client().client.chat.create_stream_async(**self._chat_call_kwargs(params), stream=True)
 
+            pending: List[ChatGenerationChunk] = []
+            # The SDK returns the complete body as one str, so split that str directly instead of copying it into a buffer.
             for line in response_stream.splitlines():
                 if not line.strip():
                     continue
 
                 try:
-                    import json
-
-                    chunk_data = json.loads(line)
-                    if "messages" in chunk_data:
-                        for message in chunk_data["messages"]:
-                            if isinstance(message, dict) and message.get("author") == "GLEAN_AI" and message.get("messageType") == "CONTENT":
-                                for fragment in message.get("fragments", []):
-                                    if "text" in fragment:
-                                        new_content = fragment.get("text", "")
-                                        if new_content:
-                                            message_chunk = AIMessageChunk(content=new_content)
-
-                                            chat_id = chunk_data.get("chatId")
-                                            if chat_id and not self._chat_id:
-                                                self._chat_id = chat_id
-
-                                            tracking_token = chunk_data.get("chatSessionTrackingToken")
-
-                                            gen_chunk = ChatGenerationChunk(
-                                                message=message_chunk, generation_info={"chat_id": chat_id, "tracking_token": tracking_token}
-                                            )
-                                            yield gen_chunk
-
-                                            if run_manager:
-                                                await run_manager.on_llm_new_token(new_content)
+                    for gen_chunk in self._parse_stream_line(line):
+                        pending.append(gen_chunk)
+                        if len(pending) < self.stream_batch_size:
+                            continue
+                        gen_chunk = self._merge_stream_chunks(pending)
+                        pending = []
+                        yield gen_chunk
+
+                        if run_manager:
+                            await run_manager.on_llm_new_token(gen_chunk.text)
                 except Exception as parsing_error:
                     if run_manager:
                         await run_manager.on_llm_error(parsing_error)
                     raise ValueError(f"Error parsing stream response: {str(parsing_error)}")
 
+                # The SDK returns the whole body at once, so hand control back to the
+                # event loop between lines rather than parsing a long response in one go.
+                await asyncio.sleep(0)
+
+            if pending:
+                gen_chunk = self._merge_stream_chunks(pending)
+                yield gen_chunk
+
+                if run_manager:
+                    await run_manager.on_llm_new_token(gen_chunk.text)
+
         except errors.GleanError as client_err:
             if run_manager:
                 await run_manager.on_llm_error(client_err)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 # ruff: noqa: I001
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, cast
 
 from glean.api_client import errors, models
 from langchain_core.callbacks import (
@@ -14,6 +14,16 @@ from pydantic import BaseModel, Field, model_validator
 
 from langchain_glean._api_client_mixin import GleanAPIClientMixin
 
+_PEOPLE = models.ListEntitiesRequestEntityType.PEOPLE
+
+
+def _person_to_document(person: Any) -> Document:
+    """Build a Document from a people-directory entry, keeping its non-empty metadata."""
+    person_metadata = getattr(person, "metadata", None)
+    metadata = {k: v for k, v in person_metadata.__dict__.items() if v} if person_metadata else {}
+    page_text = f"{getattr(person, 'name', 'Unknown')}\n{metadata.get('title', '')}".strip()
+    return Document(page_content=page_text, metadata=metadata)
+
 
 class PeopleProfileBasicRequest(BaseModel):
     """Basic subset of ``ListEntitiesRequest`` for people search.
@@ -44,7 +54,7 @@ class PeopleProfileBasicRequest(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def ensure_query_or_filter(cls, values: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
-        if not values.get("query") and not (values.get("filters") or {}):
+        if not values.get("query") and not values.get("filters"):
             raise ValueError('At least one of "query" or "filters" must be provided.')
         return values
 
@@ -127,34 +137,20 @@ class GleanPeopleProfileRetriever(GleanAPIClientMixin, BaseRetriever):
         run_manager: CallbackManagerForRetrieverRun,
         **kwargs: Any,
     ) -> List[Document]:
+        import httpx
+
         try:
             entities_req = self._build_entities_request(query, **kwargs)
-            with self._build_glean_client() as g:
-                # Use vars() instead of model_dump() due to SDK's custom serializer
-                params = {k: v for k, v in vars(entities_req).items() if not k.startswith("_") and v is not None}
-                response = g.client.entities.list(**params)
+            # Use vars() instead of model_dump() due to SDK's custom serializer
+            params = {k: v for k, v in vars(entities_req).items() if not k.startswith("_") and v is not None}
+            response = self._get_glean_client().client.entities.list(**params, retries=self._retry_config())
         except errors.GleanError as err:
             raise ValueError(f"Glean client error: {err}") from err
-        except Exception:
-            # Fallback – return empty results when the SDK call fails (e.g. no network)
+        except httpx.TransportError:
+            # Fallback – return empty results when Glean cannot be reached (timeouts, refused or dropped connections)
             return []
 
-        docs: List[Document] = []
-        people_results = getattr(response, "results", None) or []  # type: ignore[attr-defined]
-
-        for person in people_results:  # type: ignore[assignment]
-            metadata = {}
-
-            if getattr(person, "metadata", None):
-                metadata = {k: v for k, v in person.metadata.__dict__.items() if v}
-
-            name = getattr(person, "name", "Unknown")
-            title = metadata.get("title", "")
-            page_text = f"{name}\n{title}".strip()
-
-            docs.append(Document(page_content=page_text, metadata=metadata))
-
-        return docs
+        return self._response_to_documents(response)
 
     async def _aget_relevant_documents(
         self,
@@ -163,33 +159,25 @@ class GleanPeopleProfileRetriever(GleanAPIClientMixin, BaseRetriever):
         run_manager: AsyncCallbackManagerForRetrieverRun,
         **kwargs: Any,
     ) -> List[Document]:
+        import httpx
+
         try:
             entities_req = self._build_entities_request(query, **kwargs)
-            with self._build_glean_client() as g:
-                # Use vars() instead of model_dump() due to SDK's custom serializer
-                params = {k: v for k, v in vars(entities_req).items() if not k.startswith("_") and v is not None}
-                response = await g.client.entities.list_async(**params)
+            # Use vars() instead of model_dump() due to SDK's custom serializer
+            params = {k: v for k, v in vars(entities_req).items() if not k.startswith("_") and v is not None}
+            response = await self._get_glean_client().client.entities.list_async(**params, retries=self._retry_config())
         except errors.GleanError as err:
             raise ValueError(f"Glean client error: {err}") from err
-        except Exception:
+        except httpx.TransportError:
+            # Fallback – return empty results when Glean cannot be reached (timeouts, refused or dropped connections)
             return []
 
-        docs: List[Document] = []
-        people_results = getattr(response, "results", None) or []  # type: ignore[attr-defined]
-
-        for person in people_results:  # type: ignore[assignment]
-            metadata = {}
-
-            if getattr(person, "metadata", None):
-                metadata = {k: v for k, v in person.metadata.__dict__.items() if v}
-
-            name = getattr(person, "name", "Unknown")
-            title = metadata.get("title", "")
-            page_text = f"{name}\n{title}".strip()
-
-            docs.append(Document(page_content=page_text, metadata=metadata))
+        return self._response_to_documents(response)
 
-        return docs
+    @staticmethod
+    def _response_to_documents(response: Any) -> List[Document]:
+        """Convert a ``ListEntitiesResponse`` into one Document per person."""
+        return [_person_to_document(person) for person in getattr(response, "results", None) or []]
 
     def _build_entities_request(
         self,
@@ -202,39 +190,31 @@ class GleanPeopleProfileRetriever(GleanAPIClientMixin, BaseRetriever):
     ) -> models.ListEntitiesRequest:  # noqa: D401
         """Create a ``ListEntitiesRequest`` for the people directory."""
 
-        if isinstance(input_val, models.ListEntitiesRequest):
-            return input_val
+        # Exact-type checks short-circuit the common cases; isinstance still covers subclasses.
+        input_type = type(input_val)
+        if input_type is str:
+            # Plain query strings (the usual LLM/tool call) skip the model type checks entirely.
+            return models.ListEntitiesRequest(entity_type=_PEOPLE, query=cast(str, input_val), page_size=kwargs.get("page_size", self.k or 10))
 
-        if isinstance(input_val, PeopleProfileBasicRequest):
-            data = input_val
+        if input_type is models.ListEntitiesRequest or isinstance(input_val, models.ListEntitiesRequest):
+            return cast(models.ListEntitiesRequest, input_val)
 
-            req = models.ListEntitiesRequest(entity_type="PEOPLE")  # type: ignore[arg-type]
-
-            if data.page_size is not None:
-                req.page_size = data.page_size
-            else:
-                req.page_size = self.k or 10
-
-            if data.query:
-                req.query = data.query
+        if input_type is PeopleProfileBasicRequest or isinstance(input_val, PeopleProfileBasicRequest):
+            data = cast(PeopleProfileBasicRequest, input_val)
 
+            filters: Optional[List[models.FacetFilter]] = None
             if data.filters:
-                facets = []
-                for field_name, value in data.filters.items():
-                    facets.append(
-                        models.FacetFilter(
-                            field_name=field_name,
-                            values=[models.FacetFilterValue(value=value, relation_type=models.RelationType.EQUALS)],
-                        )
-                    )
-                req.filter_ = facets  # Set filter_ instead of filter
-
-            return req
-
-        req = models.ListEntitiesRequest(entity_type="PEOPLE", query=str(input_val))  # type: ignore[arg-type]
-        if "page_size" in kwargs:
-            req.page_size = kwargs["page_size"]
-        else:
-            req.page_size = self.k or 10
-
-        return req
+                equals = models.RelationType.EQUALS
+                filters = [
+                    models.FacetFilter(field_name=field_name, values=[models.FacetFilterValue(value=value, relation_type=equals)])
+                    for field_name, value in data.filters.items()
+                ]
+
+            return models.ListEntitiesRequest(
+                entity_type=_PEOPLE,
+                page_size=data.page_size if data.page_size is not None else self.k or 10,
+                query=data.query or None,
+                filter_=filters,  # Set filter_ instead of filter
+            )
+
+        return models.ListEntitiesRequest(entity_type=_PEOPLE, query=str(input_val), page_size=kwargs.get("page_size", self.k or 10))
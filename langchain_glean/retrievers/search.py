@@ -1,5 +1,10 @@
 # ruff: noqa: I001
-from typing import Any, Iterable, List, Optional, Union
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 
 from glean.api_client import errors, models
 from langchain_core.callbacks import (
@@ -8,10 +13,12 @@ from langchain_core.callbacks import (
 )
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from langchain_glean._api_client_mixin import GleanAPIClientMixin
 
+logger = logging.getLogger(__name__)
+
 
 class SearchBasicRequest(BaseModel):
     """Basic subset of ``SearchRequest`` covering the most common fields."""
@@ -38,6 +45,10 @@ class SearchBasicRequest(BaseModel):
 class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
     """Retriever that uses Glean's search API via the Glean client.
 
+    Concurrent async calls with identical parameters, ``k`` and ``act_as`` on the same
+    event loop share one Glean request. Each caller still converts the response itself
+    and reports errors, including a failed shared request, to its own callbacks.
+
     Setup:
         Install ``langchain-glean`` and set environment variables
         ``GLEAN_API_TOKEN`` and ``GLEAN_SERVER_URL``. Optionally set ``GLEAN_ACT_AS``
@@ -109,6 +120,35 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
     """
 
     k: Optional[int] = Field(default=10, description="Number of results to return. Maps to page_size in the Glean API.")
+    cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of distinct searches whose results are kept in memory. 0 (the default) disables caching.",
+    )
+    cache_ttl: float = Field(default=60.0, gt=0, description="Seconds a cached search result is reused before Glean is queried again.")
+    include_debug_info: bool = Field(
+        default=False,
+        description="Copy each result's debug_info, rendered as a string, into the Document metadata.",
+    )
+
+    # Flat ``DocumentMetadata`` fields copied into the Document metadata when set.
+    _DOC_METADATA_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "datasource_instance",
+        "object_type",
+        "mime_type",
+        "logging_id",
+        "visibility",
+        "document_category",
+        "create_time",
+        "update_time",
+    )
+
+    # Keyword arguments passed straight through to ``SearchRequest`` by ``_build_search_request``.
+    _SEARCH_REQUEST_OPTIONS: ClassVar[Tuple[str, ...]] = ("max_snippet_size", "cursor", "tracking_token", "timeout_millis", "request_options")
+
+    _cache: "OrderedDict[str, Tuple[float, List[Document]]]" = PrivateAttr(default_factory=OrderedDict)
+    _cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _inflight: "Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future[models.SearchResponse]]" = PrivateAttr(default_factory=dict)
 
     def _get_relevant_documents(
         self,
@@ -127,15 +167,24 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
         Returns:
             A list of documents relevant to the query
         """
+        if self._is_blank_search(query, kwargs):
+            return []
+
         try:
             search_request = self._build_search_request(query, **kwargs)
+            # Use vars() instead of model_dump() due to SDK's custom serializer
+            params = {k: v for k, v in vars(search_request).items() if not k.startswith("_") and v is not None}
+            k_limit = kwargs.get("k") if "k" in kwargs else self.k
+            if isinstance(k_limit, int) and k_limit <= 0:
+                return []
+
+            cache_key = self._cache_key(params, k_limit)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
             try:
-                with self._build_glean_client() as g:
-                    headers = self._http_headers()
-                    # Use vars() instead of model_dump() due to SDK's custom serializer
-                    params = {k: v for k, v in vars(search_request).items() if not k.startswith("_") and v is not None}
-                    response = g.client.search.query(**params, http_headers=headers)
+                response = self._get_glean_client().client.search.query(**params, retries=self._retry_config(), http_headers=self._http_headers())
 
             except errors.GleanError as client_err:
                 run_manager.on_retriever_error(Exception(f"Glean client error: {str(client_err)}"))
@@ -151,10 +200,10 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
                         run_manager.on_retriever_error(doc_error)
                         continue
 
-            k_limit = kwargs.get("k") if "k" in kwargs else self.k
             if k_limit is not None and isinstance(k_limit, int):
                 documents = documents[:k_limit]
 
+            self._cache_put(cache_key, documents)
             return documents
 
         except Exception as e:
@@ -178,15 +227,24 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
         Returns:
             A list of documents relevant to the query
         """
+        if self._is_blank_search(query, kwargs):
+            return []
+
         try:
             search_request = self._build_search_request(query, **kwargs)
+            # Use vars() instead of model_dump() due to SDK's custom serializer
+            params = {k: v for k, v in vars(search_request).items() if not k.startswith("_") and v is not None}
+            k_limit = kwargs.get("k") if "k" in kwargs else self.k
+            if isinstance(k_limit, int) and k_limit <= 0:
+                return []
+
+            cache_key = self._cache_key(params, k_limit)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
             try:
-                with self._build_glean_client() as g:
-                    headers = self._http_headers()
-                    # Use vars() instead of model_dump() due to SDK's custom serializer
-                    params = {k: v for k, v in vars(search_request).items() if not k.startswith("_") and v is not None}
-                    response = await g.client.search.query_async(**params, http_headers=headers)
+                response = await self._aquery_shared(params, cache_key or self._request_key(params, k_limit))
 
             except errors.GleanError as client_err:
                 await run_manager.on_retriever_error(Exception(f"Glean client error: {str(client_err)}"))
@@ -202,16 +260,140 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
                         await run_manager.on_retriever_error(doc_error)
                         continue
 
-            k_limit = kwargs.get("k") if "k" in kwargs else self.k
             if k_limit is not None and isinstance(k_limit, int):
                 documents = documents[:k_limit]
 
+            self._cache_put(cache_key, documents)
             return documents
 
         except Exception as e:
             await run_manager.on_retriever_error(e)
             return []
 
+    async def _aquery_shared(self, params: Dict[str, Any], request_key: str) -> models.SearchResponse:
+        """Send an async search, sharing one in-flight request among concurrent identical calls.
+
+        Each caller awaits the same response, or has the same exception raised into it,
+        and converts and reports on it with its own run manager.
+        """
+        flight_key = (asyncio.get_running_loop(), request_key)
+        flight = self._inflight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._get_glean_client().client.search.query_async(**params, retries=self._retry_config(), http_headers=self._http_headers())
+            )
+            self._inflight[flight_key] = flight
+            flight.add_done_callback(lambda done: self._inflight_done(flight_key, done))
+        return await asyncio.shield(flight)
+
+    def _inflight_done(self, flight_key: Tuple[asyncio.AbstractEventLoop, str], flight: "asyncio.Future[models.SearchResponse]") -> None:
+        self._inflight.pop(flight_key, None)
+        # Mark the exception as retrieved in case every waiting caller was cancelled.
+        if not flight.cancelled():
+            flight.exception()
+
+    async def astream_documents(
+        self,
+        query: Union[str, "SearchBasicRequest", models.SearchRequest],
+        **kwargs: Any,
+    ) -> AsyncIterator[Document]:
+        """Yield documents for ``query`` one search result at a time.
+
+        Unlike :meth:`ainvoke`, documents are yielded as soon as each result is
+        converted, and further result pages are fetched via the response cursor until
+        ``k`` documents have been produced. Retriever callbacks and the result cache
+        are not used; results that cannot be converted are skipped and logged.
+
+        Args:
+            query: The query to search for
+            **kwargs: Additional keyword arguments, as for :meth:`ainvoke`
+
+        Yields:
+            Document: One document per search result
+
+        Raises:
+            ValueError: If the Glean API returns an error.
+        """
+        if self._is_blank_search(query, kwargs):
+            return
+
+        search_request = self._build_search_request(query, **kwargs)
+        k_limit = kwargs.get("k") if "k" in kwargs else self.k
+        remaining = k_limit if isinstance(k_limit, int) else None
+        if remaining is not None and remaining <= 0:
+            return
+
+        try:
+            search = self._get_glean_client().client.search
+            retries = self._retry_config()
+            headers = self._http_headers()
+            while True:
+                # Use vars() instead of model_dump() due to SDK's custom serializer
+                params = {k: v for k, v in vars(search_request).items() if not k.startswith("_") and v is not None}
+                response = await search.query_async(**params, retries=retries, http_headers=headers)
+
+                for result in response.results or []:
+                    try:
+                        document = self._build_document(result)
+                    except Exception:
+                        # Skipped like in ainvoke; there is no run manager to report it to.
+                        logger.warning("Skipping Glean search result that could not be converted", exc_info=True)
+                        continue
+                    yield document
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+
+                # Without a limit only the first page is returned, as with ainvoke.
+                if remaining is None or not response.has_more_results or not response.cursor:
+                    return
+                search_request = search_request.model_copy(update={"cursor": response.cursor})
+        except errors.GleanError as client_err:
+            raise ValueError(f"Glean client error: {client_err}") from client_err
+
+    @staticmethod
+    def _is_blank_search(query: Any, kwargs: Dict[str, Any]) -> bool:
+        """Return True for a whitespace-only string query with no request options to search by."""
+        # An empty query with facet filters in ``request_options`` is still a valid browse-style search.
+        return isinstance(query, str) and not query.strip() and kwargs.get("request_options") is None
+
+    def _request_key(self, params: Dict[str, Any], k_limit: Any) -> str:
+        """Return a key identifying a search by its parameters, limit and impersonated user."""
+        # Results depend on who is searching, so the impersonated user is part of the key.
+        return repr((sorted(params.items()), k_limit, self.act_as))
+
+    def _cache_key(self, params: Dict[str, Any], k_limit: Any) -> Optional[str]:
+        """Return the result-cache key for a search, or ``None`` when caching is disabled."""
+        if not self.cache_size:
+            return None
+        return self._request_key(params, k_limit)
+
+    def _cache_get(self, key: Optional[str]) -> Optional[List[Document]]:
+        """Return copies of the cached documents for *key* if present and not expired."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return [doc.model_copy(deep=True) for doc in entry[1]]
+
+    def _cache_put(self, key: Optional[str], documents: List[Document]) -> None:
+        """Store copies of *documents* under *key*, evicting the least recently used entries."""
+        if key is None:
+            return
+        entry = (time.monotonic(), [doc.model_copy(deep=True) for doc in documents])
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def _build_search_request(self, query: Union[str, "SearchBasicRequest", models.SearchRequest], **kwargs: Any) -> models.SearchRequest:
         """Build a ``models.SearchRequest`` from either a simple :class:`SearchBasicRequest` *or* the field-by-field kwargs style used today.
         This keeps backwards compatibility while nudging users (and LLMs) toward the *minimal* input schema.
@@ -241,30 +423,13 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
 
             return sr
 
-        search_request = models.SearchRequest(query=query)  # type: ignore[arg-type]
-
-        if "k" in kwargs and kwargs.get("k") is not None:
-            raw_k = kwargs["k"]
-            raw_page_size = kwargs.get("page_size", 10)
-            search_request.page_size = max(int(raw_k), int(raw_page_size))
-        elif self.k is not None:
-            search_request.page_size = int(self.k)
-        elif "page_size" in kwargs and kwargs["page_size"] is not None:
-            search_request.page_size = int(kwargs["page_size"])
-
-        if "max_snippet_size" in kwargs:
-            search_request.max_snippet_size = kwargs["max_snippet_size"]
-        if "cursor" in kwargs:
-            search_request.cursor = kwargs["cursor"]
-        if "tracking_token" in kwargs:
-            search_request.tracking_token = kwargs["tracking_token"]
-        if "timeout_millis" in kwargs:
-            search_request.timeout_millis = kwargs["timeout_millis"]
+        # Ask Glean for only as many results as will be returned; an explicit page_size wins.
+        page_size = kwargs.get("page_size")
+        if page_size is None:
+            page_size = kwargs["k"] if kwargs.get("k") is not None else self.k
 
-        if "request_options" in kwargs:
-            search_request.request_options = kwargs["request_options"]
-
-        return search_request
+        options = {name: kwargs[name] for name in self._SEARCH_REQUEST_OPTIONS if name in kwargs}
+        return models.SearchRequest(query=query, page_size=int(page_size) if page_size is not None else None, **options)  # type: ignore[arg-type]
 
     def _build_document(self, result: models.SearchResult) -> Document:
         """
@@ -276,72 +441,50 @@ class GleanSearchRetriever(GleanAPIClientMixin, BaseRetriever):
         Returns:
             Document: LangChain Document object built from the result
         """
-        snippets = result.snippets if hasattr(result, "snippets") else []
-        text_snippets = []
-
-        if snippets:
-            for snippet in snippets:
-                if hasattr(snippet, "text") and snippet.text:
-                    text_snippets.append(str(snippet.text))
-
-        page_content = "\n".join(text_snippets) if text_snippets else ""
+        page_content = "\n".join(str(snippet.text) for snippet in getattr(result, "snippets", None) or () if getattr(snippet, "text", None))
 
-        if not page_content.strip():
-            page_content = str(result.title) if hasattr(result, "title") and result.title else ""
+        title = getattr(result, "title", "")
+        if not page_content:
+            page_content = str(title) if title else ""
 
-        document_data = result.document if hasattr(result, "document") else None
-        document_id = document_data.id if document_data and hasattr(document_data, "id") else ""
+        document_data = getattr(result, "document", None)
 
         metadata = {
-            "title": result.title if hasattr(result, "title") else "",
-            "url": result.url if hasattr(result, "url") else "",
+            "title": title,
+            "url": getattr(result, "url", ""),
             "source": "glean",
-            "document_id": document_id,
-            "tracking_token": result.tracking_token if hasattr(result, "tracking_token") else "",
+            "document_id": (getattr(document_data, "id", "") if document_data else "") or "",
+            "tracking_token": getattr(result, "tracking_token", ""),
         }
 
         if document_data:
-            if hasattr(document_data, "datasource"):
-                metadata["datasource"] = document_data.datasource
-            if hasattr(document_data, "doc_type"):
-                metadata["doc_type"] = document_data.doc_type
+            # Always present (possibly None) so callers can index them directly.
+            metadata["datasource"] = getattr(document_data, "datasource", None)
+            metadata["doc_type"] = getattr(document_data, "doc_type", None)
 
-            doc_metadata = document_data.metadata if hasattr(document_data, "metadata") else None
+            doc_metadata = getattr(document_data, "metadata", None)
             if doc_metadata:
-                for src_field, dest_field in [
-                    ("datasourceInstance", "datasource_instance"),
-                    ("objectType", "object_type"),
-                    ("mimeType", "mime_type"),
-                    ("loggingId", "logging_id"),
-                    ("visibility", "visibility"),
-                    ("documentCategory", "document_category"),
-                ]:
-                    if hasattr(doc_metadata, src_field) and getattr(doc_metadata, src_field):
-                        metadata[dest_field] = getattr(doc_metadata, src_field)
-
-                if hasattr(doc_metadata, "createTime") and doc_metadata.createTime:
-                    metadata["create_time"] = doc_metadata.createTime
-                if hasattr(doc_metadata, "updateTime") and doc_metadata.updateTime:
-                    metadata["update_time"] = doc_metadata.updateTime
-
-                if hasattr(doc_metadata, "author") and doc_metadata.author:
-                    author_data = doc_metadata.author
-                    if hasattr(author_data, "name"):
-                        metadata["author"] = author_data.name
-                    if hasattr(author_data, "email"):
-                        metadata["author_email"] = author_data.email
-
-                if hasattr(doc_metadata, "interactions") and doc_metadata.interactions:
-                    interactions = doc_metadata.interactions
-                    if hasattr(interactions, "shares") and interactions.shares:
-                        days_ago = interactions.shares[0].num_days_ago if hasattr(interactions.shares[0], "num_days_ago") else 0
-                        metadata["shared_days_ago"] = str(days_ago)
-
-        if hasattr(result, "clustered_results") and result.clustered_results is not None:
-            metadata["clustered_results_count"] = str(len(result.clustered_results))
-
-        if hasattr(result, "debug_info"):
-            metadata["debug_info"] = str(result.debug_info)
+                metadata.update({field: value for field in self._DOC_METADATA_FIELDS if (value := getattr(doc_metadata, field, None))})
+
+                author_data = getattr(doc_metadata, "author", None)
+                if author_data:
+                    metadata["author"] = getattr(author_data, "name", None)
+                    metadata["author_email"] = getattr(author_data, "email", None)
+
+                interactions = getattr(doc_metadata, "interactions", None)
+                shares = getattr(interactions, "shares", None) if interactions else None
+                if shares:
+                    metadata["shared_days_ago"] = str(getattr(shares[0], "num_days_ago", 0))
+
+        clustered_results = getattr(result, "clustered_results", None)
+        if clustered_results is not None:
+            metadata["clustered_results_count"] = str(len(clustered_results))
+
+        # Rendering debug_info can be costly, so it is only done on request.
+        if self.include_debug_info:
+            debug_info = getattr(result, "debug_info", None)
+            if debug_info is not None:
+                metadata["debug_info"] = str(debug_info)
 
         return Document(
             page_content=page_content,
@@ -21,8 +21,7 @@ class GleanGetAgentSchemaTool(GleanAPIClientMixin, BaseTool):
 
     def _run(self, agent_id: str, **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = g.client.agents.retrieve_schemas(agent_id=agent_id)
+            response = self._get_glean_client().client.agents.retrieve_schemas(agent_id=agent_id)
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
@@ -38,8 +37,7 @@ class GleanGetAgentSchemaTool(GleanAPIClientMixin, BaseTool):
 
     async def _arun(self, agent_id: str, **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = await g.client.agents.retrieve_schemas_async(agent_id=agent_id)
+            response = await self._get_glean_client().client.agents.retrieve_schemas_async(agent_id=agent_id)
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
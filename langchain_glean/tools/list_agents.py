@@ -14,8 +14,7 @@ class GleanListAgentsTool(GleanAPIClientMixin, BaseTool):
 
     def _run(self, **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = g.client.agents.list()
+            response = self._get_glean_client().client.agents.list()
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
@@ -31,8 +30,7 @@ class GleanListAgentsTool(GleanAPIClientMixin, BaseTool):
 
     async def _arun(self, **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = await g.client.agents.list_async()
+            response = await self._get_glean_client().client.agents.list_async()
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
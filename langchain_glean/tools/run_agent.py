@@ -23,8 +23,7 @@ class GleanRunAgentTool(GleanAPIClientMixin, BaseTool):
 
     def _run(self, agent_id: str, fields: Dict[str, str], **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = g.client.agents.run(agent_id=agent_id, input=fields)
+            response = self._get_glean_client().client.agents.run(agent_id=agent_id, input=fields)
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
@@ -40,8 +39,7 @@ class GleanRunAgentTool(GleanAPIClientMixin, BaseTool):
 
     async def _arun(self, agent_id: str, fields: Dict[str, str], **kwargs: Any) -> str:  # noqa: D401
         try:
-            with self._build_glean_client() as g:
-                response = await g.client.agents.run_async(agent_id=agent_id, input=fields)
+            response = await self._get_glean_client().client.agents.run_async(agent_id=agent_id, input=fields)
 
             if hasattr(response, "model_dump_json"):
                 return response.model_dump_json(indent=2)
@@ -1,6 +1,8 @@
-from typing import Any, Dict, Union
+import json
+from typing import Any, Dict, List, Literal, Union
 
 from glean.api_client import errors
+from langchain_core.documents import Document
 from langchain_core.tools import BaseTool
 from pydantic import Field
 
@@ -21,8 +23,44 @@ class GleanSearchTool(BaseTool):
     retriever: GleanSearchRetriever = Field(..., description="The GleanSearchRetriever to use for searching")
     return_direct: bool = False
 
+    return_format: Literal["text", "json"] = Field(
+        default="text",
+        description='How results are returned: "text" for a readable listing, or "json" for a JSON array of objects '
+        "with title, url, datasource and content keys.",
+    )
+
     args_schema: type = SearchBasicRequest
 
+    def _format_docs(self, docs: List[Document]) -> str:
+        """Render search results in the configured ``return_format``."""
+        if self.return_format == "json":
+            return json.dumps(
+                [
+                    {
+                        "title": doc.metadata.get("title"),
+                        "url": doc.metadata.get("url"),
+                        "datasource": doc.metadata.get("datasource"),
+                        "content": doc.page_content,
+                    }
+                    for doc in docs
+                ]
+            )
+
+        if not docs:
+            return "No results found."
+
+        results_str = []
+        for i, doc in enumerate(docs):
+            title = doc.metadata.get("title", "Untitled")
+            url = doc.metadata.get("url", "No URL")
+            source = doc.metadata.get("datasource", "Unknown Source")
+            results_str.append(f"Result {i + 1}: {title} ({source})")
+            results_str.append(f"URL: {url}")
+            results_str.append(f"Content: {doc.page_content}")
+            results_str.append("")
+
+        return "\n".join(results_str)
+
     def _run(self, query: Union[str, Dict[str, Any], SearchBasicRequest]) -> str:
         """Run the tool.
 
@@ -39,24 +77,11 @@ class GleanSearchTool(BaseTool):
                 query_str = query.pop("query", "")
                 docs = self.retriever.invoke(query_str, **query)
 
-            if not docs:
-                return "No results found."
-
-            results_str = []
-            for i, doc in enumerate(docs):
-                title = doc.metadata.get("title", "Untitled")
-                url = doc.metadata.get("url", "No URL")
-                source = doc.metadata.get("datasource", "Unknown Source")
-                results_str.append(f"Result {i + 1}: {title} ({source})")
-                results_str.append(f"URL: {url}")
-                results_str.append(f"Content: {doc.page_content}")
-                results_str.append("")
-
-            return "\n".join(results_str)
+            return self._format_docs(docs)
 
         except errors.GleanError as e:
             error_details = f"Glean API error: {str(e)}"
-            if hasattr(e, "raw_response") and e.raw_response:
+            if getattr(e, "raw_response", None):
                 error_details += f": {e.raw_response}"
             return error_details
         except Exception as e:
@@ -78,24 +103,11 @@ class GleanSearchTool(BaseTool):
                 query_str = query.pop("query", "")
                 docs = await self.retriever.ainvoke(query_str, **query)
 
-            if not docs:
-                return "No results found."
-
-            results_str = []
-            for i, doc in enumerate(docs):
-                title = doc.metadata.get("title", "Untitled")
-                url = doc.metadata.get("url", "No URL")
-                source = doc.metadata.get("datasource", "Unknown Source")
-                results_str.append(f"Result {i + 1}: {title} ({source})")
-                results_str.append(f"URL: {url}")
-                results_str.append(f"Content: {doc.page_content}")
-                results_str.append("")
-
-            return "\n".join(results_str)
+            return self._format_docs(docs)
 
         except errors.GleanError as e:
             error_details = f"Glean API error: {str(e)}"
-            if hasattr(e, "raw_response") and e.raw_response:
+            if getattr(e, "raw_response", None):
                 error_details += f": {e.raw_response}"
             return error_details
         except Exception as e:
@@ -0,0 +1,56 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, Iterator, Optional
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from langchain_glean._api_client_mixin import _shared_glean_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_glean_client() -> Iterator[None]:
+    """Keep the process-wide SDK client cache from leaking mocks between tests."""
+    _shared_glean_client.cache_clear()
+    yield
+    _shared_glean_client.cache_clear()
+
+
+class _LoopBoundTransport(httpx.AsyncBaseTransport):
+    """Serve canned JSON responses, failing like a pooled connection when reused on another loop."""
+
+    def __init__(self, routes: Dict[str, Any]) -> None:
+        self._routes = routes
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        body = self._routes[request.url.path]
+        if request.headers.get("accept") == "text/plain":
+            # Streaming endpoints return newline-delimited JSON as text.
+            return httpx.Response(200, text=json.dumps(body))
+        return httpx.Response(200, json=body)
+
+
+@pytest.fixture
+def glean_async_api() -> Iterator[Dict[str, Any]]:
+    """Route the SDK's async requests to canned JSON keyed by URL path, e.g. ``/rest/api/v1/search``.
+
+    Requests that accept ``text/plain`` (streaming chat) get the same body as a single text line.
+
+    Every ``httpx.AsyncClient`` the wrappers create is bound to the first event loop that
+    uses it, so sharing one client across ``asyncio.run`` calls fails as it would in production.
+    """
+    routes: Dict[str, Any] = {}
+    real_async_client: Callable[..., httpx.AsyncClient] = httpx.AsyncClient
+
+    def async_client(**kwargs: Any) -> httpx.AsyncClient:
+        return real_async_client(transport=_LoopBoundTransport(routes), follow_redirects=kwargs.get("follow_redirects", False))
+
+    with patch("httpx.AsyncClient", side_effect=async_client):
+        yield routes
@@ -2,6 +2,7 @@ import os
 from typing import Any, Dict, List, Type
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
@@ -60,12 +61,12 @@ class TestGleanAgentChatModel:
         os.environ["GLEAN_API_TOKEN"] = "test-api-token"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Mock the client property of the Glean instance
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
 
         # Create mock agents client
         mock_agents = MagicMock()
@@ -111,6 +112,12 @@ class TestGleanAgentChatModel:
         assert self.chat_model is not None
         assert self.chat_model.agent_id == "test-agent-id"
 
+    def test_initialization_ignores_unknown_kwargs(self):
+        """Test that undeclared constructor kwargs are dropped rather than stored on the model."""
+        chat_model = ChatGleanAgent(agent_id="test-agent-id", unknown_option="value")
+        assert not chat_model.__pydantic_extra__
+        assert not hasattr(chat_model, "unknown_option")
+
     def test_initialization_with_missing_env_vars(self):
         """Test initialization with missing environment variables."""
         del os.environ["GLEAN_INSTANCE"]
@@ -143,9 +150,38 @@ class TestGleanAgentChatModel:
         assert result.generations[0].message.content == "This is a mock response from Glean Agent."
 
         # Verify the run method was called with correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.assert_called_once_with(
-            agent_id="test-agent-id", input={"input": "Hello, how are you?"}
-        )
+        self.mock_glean.return_value.client.agents.run.assert_called_once_with(agent_id="test-agent-id", input={"input": "Hello, how are you?"})
+
+    def test_generate_reuses_client(self):
+        """Test that the SDK client is built once and reused across calls."""
+        self.chat_model._generate(self.messages)
+        self.chat_model._generate(self.messages)
+
+        self.mock_glean.assert_called_once()
+        assert self.mock_glean.return_value.client.agents.run.call_count == 2
+
+    def test_client_shared_across_instances(self):
+        """Test that models with the same credentials share one SDK client."""
+        other = ChatGleanAgent(agent_id="other-agent-id")
+
+        self.chat_model._generate(self.messages)
+        other._generate(self.messages)
+
+        self.mock_glean.assert_called_once()
+
+    def test_generate_uses_last_ai_message(self):
+        """Test that only the most recent Glean AI message becomes the reply."""
+        mock_response = MagicMock()
+        mock_response.messages = [
+            {"author": "GLEAN_AI", "fragments": [{"text": "Earlier answer."}]},
+            {"author": "USER", "fragments": [{"text": "Follow-up"}]},
+            {"author": "GLEAN_AI", "fragments": [{"text": "Final "}, {"text": "answer."}, {"querySuggestion": {}}]},
+        ]
+        self.mock_glean.return_value.client.agents.run.return_value = mock_response
+
+        result = self.chat_model._generate(self.messages)
+
+        assert result.generations[0].message.content == "Final answer."
 
     def test_generate_with_custom_fields(self):
         """Test generating a response with custom fields."""
@@ -156,7 +192,17 @@ class TestGleanAgentChatModel:
         assert result.generations[0].message.content == "This is a mock response from Glean Agent."
 
         # Verify the run method was called with the custom fields
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.assert_called_once_with(agent_id="test-agent-id", input=custom_fields)
+        self.mock_glean.return_value.client.agents.run.assert_called_once_with(agent_id="test-agent-id", input=custom_fields)
+
+    def test_generate_does_not_mutate_fields(self):
+        """Test that the caller's fields mapping is not modified when input is filled in."""
+        custom_fields = {"param1": "value1"}
+        self.chat_model._generate(self.messages, fields=custom_fields)
+
+        assert custom_fields == {"param1": "value1"}
+        self.mock_glean.return_value.client.agents.run.assert_called_once_with(
+            agent_id="test-agent-id", input={"param1": "value1", "input": "Hello, how are you?"}
+        )
 
     def test_generate_with_error(self):
         """Test error handling in _generate."""
@@ -165,16 +211,16 @@ class TestGleanAgentChatModel:
         # Mock GleanError with required raw_response
         mock_response = MagicMock()
         error = errors.GleanError("Test error", raw_response=mock_response)
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.side_effect = error
+        self.mock_glean.return_value.client.agents.run.side_effect = error
 
         with pytest.raises(ValueError) as exc_info:
             self.chat_model._generate(self.messages)
 
         assert "Glean client error" in str(exc_info.value)
 
-    def test_generate_with_generic_exception(self):
-        """Test generic exception handling in _generate."""
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.side_effect = Exception("Network error")
+    def test_generate_with_network_error(self):
+        """Test that connection failures in _generate return the offline placeholder."""
+        self.mock_glean.return_value.client.agents.run.side_effect = httpx.ConnectError("Network error")
 
         result = self.chat_model._generate(self.messages)
 
@@ -182,6 +228,13 @@ class TestGleanAgentChatModel:
         assert "(offline)" in result.generations[0].message.content
         assert "Unable to reach Glean" in result.generations[0].message.content
 
+    def test_generate_with_generic_exception(self):
+        """Test that non-network exceptions in _generate propagate."""
+        self.mock_glean.return_value.client.agents.run.side_effect = RuntimeError("Unexpected failure")
+
+        with pytest.raises(RuntimeError):
+            self.chat_model._generate(self.messages)
+
     def test_generate_with_stop_sequences(self):
         """Test that providing stop sequences raises an error."""
         with pytest.raises(ValueError) as exc_info:
@@ -200,7 +253,7 @@ class TestGleanAgentChatModel:
             mock_response.messages = [mock_message]
             return mock_response
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         result = await self.chat_model._agenerate(self.messages)
 
@@ -218,7 +271,7 @@ class TestGleanAgentChatModel:
             mock_response.messages = [mock_message]
             return mock_response
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         custom_fields = {"input": "Custom input", "param1": "value1"}
         result = await self.chat_model._agenerate(self.messages, fields=custom_fields)
@@ -239,7 +292,7 @@ class TestGleanAgentChatModel:
         async def mock_run_async_error(*args, **kwargs):
             raise error
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async_error
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async_error
 
         with pytest.raises(ValueError) as exc_info:
             await self.chat_model._agenerate(self.messages)
@@ -247,14 +300,14 @@ class TestGleanAgentChatModel:
         assert "Glean client error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_agenerate_with_generic_exception(self):
-        """Test generic exception handling in _agenerate."""
+    async def test_agenerate_with_network_error(self):
+        """Test that connection failures in _agenerate return the offline placeholder."""
 
-        # Override the run_async method to raise a generic exception
+        # Override the run_async method to raise a connection error
         async def mock_run_async_error(*args, **kwargs):
-            raise Exception("Network error")
+            raise httpx.ConnectError("Network error")
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async_error
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async_error
 
         result = await self.chat_model._agenerate(self.messages)
 
@@ -262,6 +315,18 @@ class TestGleanAgentChatModel:
         assert "(offline)" in result.generations[0].message.content
         assert "Unable to reach Glean" in result.generations[0].message.content
 
+    @pytest.mark.asyncio
+    async def test_agenerate_with_generic_exception(self):
+        """Test that non-network exceptions in _agenerate propagate."""
+
+        async def mock_run_async_error(*args, **kwargs):
+            raise RuntimeError("Unexpected failure")
+
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async_error
+
+        with pytest.raises(RuntimeError):
+            await self.chat_model._agenerate(self.messages)
+
     @pytest.mark.asyncio
     async def test_agenerate_with_stop_sequences(self):
         """Test that providing stop sequences raises an error in _agenerate."""
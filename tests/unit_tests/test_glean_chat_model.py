@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Any, Dict, List, Type
 from unittest.mock import MagicMock, patch
@@ -61,12 +62,12 @@ class TestGleanChatModel:
         os.environ["GLEAN_API_TOKEN"] = "test-api-token"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Mock the client property of the Glean instance
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
 
         # Create mock chat client
         mock_chat = MagicMock()
@@ -141,6 +142,22 @@ class TestGleanChatModel:
         with pytest.raises(ValueError):
             ChatGlean()
 
+    def test_prewarm(self):
+        """Test that prewarm opens a connection in a background thread only when enabled."""
+        with patch("langchain_glean.chat_models.chat.threading.Thread") as mock_thread:
+            ChatGlean()
+            mock_thread.assert_not_called()
+
+            chat = ChatGlean(prewarm=True)
+            mock_thread.assert_called_once_with(target=chat._prewarm, args=(self.mock_glean.return_value,), daemon=True)
+            mock_thread.return_value.start.assert_called_once()
+
+        sdk_configuration = self.mock_glean.return_value.sdk_configuration
+        sdk_configuration.get_server_details.return_value = ("https://{instance}-be.glean.com", {"instance": "acme"})
+        chat._prewarm(self.mock_glean.return_value)
+        sdk_configuration.client.build_request.assert_called_once_with("HEAD", "https://acme-be.glean.com")
+        sdk_configuration.client.send.assert_called_once_with(sdk_configuration.client.build_request.return_value)
+
     def test_convert_message_to_glean_format(self):
         """Test converting LangChain messages to Glean format."""
         human_msg = HumanMessage(content="Hello, Glean!")
@@ -163,6 +180,57 @@ class TestGleanChatModel:
         assert glean_msg.message_type == "CONTEXT"
         assert glean_msg.fragments[0].text == "You are an AI assistant."
 
+    def test_convert_multipart_content_to_glean_format(self):
+        """Test that list content is flattened to its text parts instead of being stringified."""
+        message = HumanMessage(content=["Hello ", {"type": "text", "text": "world"}, {"type": "image_url", "image_url": {"url": "https://x"}}])
+        glean_msg = self.chat_model._convert_message_to_glean_format(message)
+
+        assert glean_msg.fragments[0].text == "Hello world"
+
+    def test_convert_chat_message_roles_to_glean_format(self):
+        """Test that ChatMessage roles and message subclasses map to the right Glean author."""
+        from langchain_core.messages import AIMessageChunk, ChatMessage
+
+        assert self.chat_model._convert_message_to_glean_format(ChatMessage(role="assistant", content="hi")).author == "GLEAN_AI"
+        assert self.chat_model._convert_message_to_glean_format(ChatMessage(role="ai", content="hi")).author == "GLEAN_AI"
+        assert self.chat_model._convert_message_to_glean_format(ChatMessage(role="user", content="hi")).author == "USER"
+        assert self.chat_model._convert_message_to_glean_format(ChatMessage(role="tool", content="hi")).author == "USER"
+
+        chunk_msg = self.chat_model._convert_message_to_glean_format(AIMessageChunk(content="partial"))
+        assert chunk_msg.author == "GLEAN_AI"
+        assert chunk_msg.message_type == "CONTENT"
+
+    def test_default_agent_config_reused(self):
+        """Test that the AgentConfig built from dict overrides is reused across calls."""
+        messages = [HumanMessage(content="Hello")]
+
+        first = self.chat_model._build_chat_params(messages)
+        second = self.chat_model._build_chat_params(messages)
+        assert first.agent_config is second.agent_config
+        assert first.agent_config.agent == "DEFAULT"
+
+        custom = self.chat_model._build_chat_params(messages, agent_config={"agent": "GPT", "mode": "QUICK"})
+        assert custom.agent_config is not first.agent_config
+        assert (custom.agent_config.agent, custom.agent_config.mode) == ("GPT", "QUICK")
+
+    def test_build_chat_params_overrides(self):
+        """Test that per-call overrides end up on the ChatRequest."""
+        request = self.chat_model._build_chat_params(
+            [HumanMessage(content="Hello")],
+            save_chat=True,
+            chat_id="chat-1",
+            inclusions={"datasource_instances": ["github"]},
+            timeout_millis=30000,
+            application_id="app",
+        )
+
+        assert request.save_chat is True
+        assert request.chat_id == "chat-1"
+        assert request.inclusions.datasource_instances == ["github"]
+        assert request.exclusions is None
+        assert request.timeout_millis == 30000
+        assert request.application_id == "app"
+
     def test_generate(self):
         """Test generating a response from the chat model."""
         # Create a mock ChatRequest
@@ -185,7 +253,64 @@ class TestGleanChatModel:
         assert result.generations[0].generation_info["tracking_token"] == "mock-tracking-token"
 
         assert self.chat_model.chat_id == "mock-chat-id"
-        self.mock_glean.return_value.__enter__.return_value.client.chat.create.assert_called_once()
+        self.mock_glean.return_value.client.chat.create.assert_called_once()
+
+    def test_generate_uses_last_ai_message(self):
+        """Test that the last AI content message is returned when several are present."""
+        from types import SimpleNamespace
+
+        response = SimpleNamespace(
+            messages=[
+                {"author": "GLEAN_AI", "messageType": "CONTENT", "fragments": [{"text": "first"}]},
+                {"author": "GLEAN_AI", "messageType": "CONTENT", "fragments": [{"text": "second"}]},
+                {"author": "GLEAN_AI", "messageType": "CONTEXT", "fragments": [{"text": "context"}]},
+            ],
+            chatId="chat-2",
+            chatSessionTrackingToken=None,
+        )
+        self.mock_glean.return_value.client.chat.create.return_value = response
+
+        result = self.chat_model._generate([HumanMessage(content="Hello")])
+
+        assert result.generations[0].message.content == "second"
+        assert self.chat_model.chat_id == "chat-2"
+
+    def test_stream(self):
+        """Test streaming a response from the chat model."""
+        chunks = list(self.chat_model._stream(self.messages))
+
+        assert [chunk.text for chunk in chunks] == ["This is ", "a streaming response."]
+        assert self.chat_model.chat_id == "mock-chat-id"
+
+    def test_stream_batch_size(self):
+        """Test that stream_batch_size merges fragments and flushes the remainder at the end."""
+        chat = ChatGlean(stream_batch_size=2)
+        chunks = list(chat._stream(self.messages))
+        assert [chunk.text for chunk in chunks] == ["This is a streaming response."]
+        assert chat.chat_id == "mock-chat-id"
+
+        chunks = list(ChatGlean(stream_batch_size=5)._stream(self.messages))
+        assert [chunk.text for chunk in chunks] == ["This is a streaming response."]
+
+    def test_client_shared_across_instances(self):
+        """Test that chat models with the same credentials share one SDK client."""
+        list(self.chat_model._stream(self.messages))
+        list(ChatGlean()._stream(self.messages))
+
+        self.mock_glean.assert_called_once()
+        assert self.mock_glean.return_value.client.chat.create_stream.call_count == 2
+
+    async def test_astream(self):
+        """Test async streaming a response from the chat model."""
+
+        async def mock_create_stream_async(*args, **kwargs):
+            return self.mock_glean.return_value.client.chat.create_stream.return_value
+
+        self.mock_glean.return_value.client.chat.create_stream_async = mock_create_stream_async
+
+        chunks = [chunk async for chunk in self.chat_model._astream(self.messages)]
+
+        assert [chunk.text for chunk in chunks] == ["This is ", "a streaming response."]
 
     # ===== ADVANCED TESTS =====
 
@@ -224,6 +349,32 @@ class TestGleanChatModel:
             args = mock_generate.call_args[0]
             assert args[0] == expected_messages
 
+    async def test_abatch_runs_concurrently(self):
+        """Test that abatch overlaps requests, bounded by max_concurrency."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+        response = self.mock_glean.return_value.client.chat.create.return_value
+
+        async def mock_create_async(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return response
+
+        self.mock_glean.return_value.client.chat.create_async = mock_create_async
+
+        results = await self.chat_model.abatch([self.messages] * 4)
+        assert len(results) == 4
+        assert peak == 4
+
+        peak = 0
+        await self.chat_model.abatch([self.messages] * 4, config={"max_concurrency": 2})
+        assert peak == 2
+
     async def test_ainvoke_with_basic_request(self):
         """Test async invoking with a ChatBasicRequest object."""
         with (
@@ -291,3 +442,19 @@ class TestGleanChatModel:
             assert kwargs["timeout_millis"] == 30000
             assert kwargs["inclusions"]["url_patterns"] == ["https://glean.com/*"]
             assert kwargs["exclusions"]["url_patterns"] == ["https://glean.com/blog/*"]
+
+
+def test_async_calls_from_separate_event_loops(glean_async_api):
+    """Test that agenerate and astream keep working when each call runs on a new event loop."""
+    glean_async_api["/rest/api/v1/chat"] = {
+        "chatId": "chat-123",
+        "messages": [{"author": "GLEAN_AI", "messageType": "CONTENT", "fragments": [{"text": "Hello from Glean"}]}],
+    }
+    chat = ChatGlean(server_url="https://acme-be.glean.com", api_token="test-token")
+
+    async def stream() -> str:
+        return "".join([str(chunk.content) async for chunk in chat.astream("Hi")])
+
+    for _ in range(2):
+        assert asyncio.run(chat.ainvoke("Hi")).content == "Hello from Glean"
+        assert asyncio.run(stream()) == "Hello from Glean"
@@ -17,12 +17,12 @@ class TestGleanGetAgentSchemaTool:
         os.environ["GLEAN_API_TOKEN"] = "test-api-token"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Mock the client property of the Glean instance
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
 
         # Create mock agents client
         mock_agents = MagicMock()
@@ -67,7 +67,7 @@ class TestGleanGetAgentSchemaTool:
         result = self.tool._run(agent_id=agent_id)
 
         # Verify that retrieve_schemas was called with the correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas.assert_called_once_with(agent_id=agent_id)
+        self.mock_glean.return_value.client.agents.retrieve_schemas.assert_called_once_with(agent_id=agent_id)
 
         expected_json = '{"inputs": [{"name": "input", "type": "STRING", "required": true}]}'
         assert result == expected_json
@@ -78,12 +78,12 @@ class TestGleanGetAgentSchemaTool:
 
         # Mock response that doesn't have model_dump_json
         mock_response = "Raw string response"
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas.return_value = mock_response
+        self.mock_glean.return_value.client.agents.retrieve_schemas.return_value = mock_response
 
         result = self.tool._run(agent_id=agent_id)
 
         # Verify that retrieve_schemas was called with the correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas.assert_called_once_with(agent_id=agent_id)
+        self.mock_glean.return_value.client.agents.retrieve_schemas.assert_called_once_with(agent_id=agent_id)
 
         assert result == "Raw string response"
 
@@ -95,7 +95,7 @@ class TestGleanGetAgentSchemaTool:
         mock_response = MagicMock()
         mock_response.text = "Raw error response"
         error = errors.GleanError("Test error", raw_response=mock_response)
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas.side_effect = error
+        self.mock_glean.return_value.client.agents.retrieve_schemas.side_effect = error
 
         result = self.tool._run(agent_id="test-agent-id")
 
@@ -105,7 +105,7 @@ class TestGleanGetAgentSchemaTool:
     def test_run_with_generic_exception(self) -> None:
         """Test _run when a generic exception occurs."""
         # Mock generic exception
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas.side_effect = Exception("Generic error")
+        self.mock_glean.return_value.client.agents.retrieve_schemas.side_effect = Exception("Generic error")
 
         result = self.tool._run(agent_id="test-agent-id")
 
@@ -123,7 +123,7 @@ class TestGleanGetAgentSchemaTool:
             mock_response.model_dump_json.return_value = '{"inputs": [{"name": "input", "type": "STRING", "required": true}]}'
             return mock_response
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
+        self.mock_glean.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
 
         result = await self.tool._arun(agent_id=agent_id)
 
@@ -139,7 +139,7 @@ class TestGleanGetAgentSchemaTool:
         async def mock_retrieve_schemas_async(*args, **kwargs):
             return "Raw string response"
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
+        self.mock_glean.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
 
         result = await self.tool._arun(agent_id=agent_id)
 
@@ -159,7 +159,7 @@ class TestGleanGetAgentSchemaTool:
         async def mock_retrieve_schemas_async(*args, **kwargs):
             raise error
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
+        self.mock_glean.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
 
         result = await self.tool._arun(agent_id="test-agent-id")
 
@@ -174,7 +174,7 @@ class TestGleanGetAgentSchemaTool:
         async def mock_retrieve_schemas_async(*args, **kwargs):
             raise Exception("Generic error")
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
+        self.mock_glean.return_value.client.agents.retrieve_schemas_async = mock_retrieve_schemas_async
 
         result = await self.tool._arun(agent_id="test-agent-id")
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from unittest.mock import MagicMock, patch
 
@@ -17,12 +18,12 @@ class TestGleanListAgentsTool:
         os.environ["GLEAN_API_TOKEN"] = "test-api-token"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Mock the client property of the Glean instance
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
 
         # Create mock agents client
         mock_agents = MagicMock()
@@ -62,7 +63,7 @@ class TestGleanListAgentsTool:
         result = self.tool._run()
 
         # Verify that list was called
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list.assert_called_once()
+        self.mock_glean.return_value.client.agents.list.assert_called_once()
 
         expected_json = '{"agents": [{"id": "agent1", "name": "Test Agent"}]}'
         assert result == expected_json
@@ -71,12 +72,12 @@ class TestGleanListAgentsTool:
         """Test _run with a response that doesn't support model_dump_json."""
         # Mock response that doesn't have model_dump_json
         mock_response = "Raw string response"
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list.return_value = mock_response
+        self.mock_glean.return_value.client.agents.list.return_value = mock_response
 
         result = self.tool._run()
 
         # Verify that list was called
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list.assert_called_once()
+        self.mock_glean.return_value.client.agents.list.assert_called_once()
 
         assert result == "Raw string response"
 
@@ -88,7 +89,7 @@ class TestGleanListAgentsTool:
         mock_response = MagicMock()
         mock_response.text = "Raw error response"
         error = errors.GleanError("Test error", raw_response=mock_response)
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list.side_effect = error
+        self.mock_glean.return_value.client.agents.list.side_effect = error
 
         result = self.tool._run()
 
@@ -98,7 +99,7 @@ class TestGleanListAgentsTool:
     def test_run_with_generic_exception(self) -> None:
         """Test _run when a generic exception occurs."""
         # Mock generic exception
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list.side_effect = Exception("Generic error")
+        self.mock_glean.return_value.client.agents.list.side_effect = Exception("Generic error")
 
         result = self.tool._run()
 
@@ -115,7 +116,7 @@ class TestGleanListAgentsTool:
             mock_response.model_dump_json.return_value = '{"agents": [{"id": "agent1", "name": "Test Agent"}]}'
             return mock_response
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list_async = mock_list_async
+        self.mock_glean.return_value.client.agents.list_async = mock_list_async
 
         result = await self.tool._arun()
 
@@ -130,7 +131,7 @@ class TestGleanListAgentsTool:
         async def mock_list_async(*args, **kwargs):
             return "Raw string response"
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list_async = mock_list_async
+        self.mock_glean.return_value.client.agents.list_async = mock_list_async
 
         result = await self.tool._arun()
 
@@ -150,7 +151,7 @@ class TestGleanListAgentsTool:
         async def mock_list_async(*args, **kwargs):
             raise error
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list_async = mock_list_async
+        self.mock_glean.return_value.client.agents.list_async = mock_list_async
 
         result = await self.tool._arun()
 
@@ -165,9 +166,18 @@ class TestGleanListAgentsTool:
         async def mock_list_async(*args, **kwargs):
             raise Exception("Generic error")
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.list_async = mock_list_async
+        self.mock_glean.return_value.client.agents.list_async = mock_list_async
 
         result = await self.tool._arun()
 
         assert "Error listing agents" in result
         assert "Generic error" in result
+
+
+def test_arun_from_separate_event_loops(glean_async_api):
+    """Test that the shared client serves _arun calls made from different event loops."""
+    glean_async_api["/rest/api/v1/agents/search"] = {"agents": [{"agent_id": "agent-1", "name": "Helper", "capabilities": {}}]}
+    tool = GleanListAgentsTool(server_url="https://acme-be.glean.com", api_token="test-token")
+
+    for _ in range(2):
+        assert '"agent_id": "agent-1"' in asyncio.run(tool._arun())
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -26,13 +27,13 @@ class TestGleanPeopleProfileRetriever:
         os.environ["GLEAN_ACT_AS"] = "test@example.com"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Create mock entities client
         mock_entities = MagicMock()
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
         mock_client.entities = mock_entities
 
         # Create mock sample data
@@ -113,8 +114,8 @@ class TestGleanPeopleProfileRetriever:
         docs = self.retriever.invoke("software engineer")
 
         # Verify the entities.list method was called with the correct parameters (SDK 0.11+ uses unpacked kwargs)
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.assert_called_once()
-        call_args = self.mock_glean.return_value.__enter__.return_value.client.entities.list.call_args
+        self.mock_glean.return_value.client.entities.list.assert_called_once()
+        call_args = self.mock_glean.return_value.client.entities.list.call_args
 
         # Check the unpacked kwargs
         assert call_args[1]["query"] == "software engineer"
@@ -142,8 +143,8 @@ class TestGleanPeopleProfileRetriever:
         _ = self.retriever.invoke(request)
 
         # Verify the entities.list method was called with the correct parameters (SDK 0.11+ uses unpacked kwargs)
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.assert_called_once()
-        call_args = self.mock_glean.return_value.__enter__.return_value.client.entities.list.call_args
+        self.mock_glean.return_value.client.entities.list.assert_called_once()
+        call_args = self.mock_glean.return_value.client.entities.list.call_args
 
         # Check the unpacked kwargs
         assert call_args[1]["query"] == "engineer"
@@ -158,7 +159,7 @@ class TestGleanPeopleProfileRetriever:
         _ = self.retriever.invoke(request)
 
         # Verify the entities.list method was called with the correct parameters (SDK 0.11+ uses unpacked kwargs)
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.assert_called_once()
+        self.mock_glean.return_value.client.entities.list.assert_called_once()
 
     def test_invoke_with_native_request(self) -> None:
         """Test the invoke method with a native ListEntitiesRequest."""
@@ -177,8 +178,8 @@ class TestGleanPeopleProfileRetriever:
         docs = self.retriever.invoke(entities_request)
 
         # Verify the entities.list method was called with unpacked request params (SDK 0.11+)
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.assert_called_once()
-        call_args = self.mock_glean.return_value.__enter__.return_value.client.entities.list.call_args
+        self.mock_glean.return_value.client.entities.list.assert_called_once()
+        call_args = self.mock_glean.return_value.client.entities.list.call_args
         assert call_args[1]["query"] == "manager"
 
         # Check the documents returned
@@ -189,7 +190,7 @@ class TestGleanPeopleProfileRetriever:
         docs = await self.retriever.ainvoke("software engineer")
 
         # Verify the entities.list_async method was called with the correct parameters
-        assert self.mock_glean.return_value.__enter__.return_value.client.entities.list_async.called
+        assert self.mock_glean.return_value.client.entities.list_async.called
 
         # Check the documents returned
         assert len(docs) == 2
@@ -216,14 +217,32 @@ class TestGleanPeopleProfileRetriever:
         # Simulate a GleanError with required raw_response
         mock_response = MagicMock()
         error = errors.GleanError("Test error", raw_response=mock_response)
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.side_effect = error
+        self.mock_glean.return_value.client.entities.list.side_effect = error
 
         with pytest.raises(ValueError, match="Glean client error"):
             self.retriever.invoke("test query")
 
-        # Simulate a generic exception
-        self.mock_glean.return_value.__enter__.return_value.client.entities.list.side_effect = Exception("Generic error")
+        # Simulate a network failure
+        import httpx
 
-        # Should return empty list rather than raise for generic exceptions
+        self.mock_glean.return_value.client.entities.list.side_effect = httpx.ConnectError("Connection refused")
+
+        # Should return empty list rather than raise when Glean is unreachable
         docs = self.retriever.invoke("test query")
         assert len(docs) == 0
+
+        # Other exceptions are bugs and propagate
+        self.mock_glean.return_value.client.entities.list.side_effect = RuntimeError("Generic error")
+
+        with pytest.raises(RuntimeError, match="Generic error"):
+            self.retriever.invoke("test query")
+
+
+def test_ainvoke_from_separate_event_loops(glean_async_api):
+    """Test that the shared client serves ainvoke calls made from different event loops."""
+    glean_async_api["/rest/api/v1/listentities"] = {"results": [{"name": "Jane Doe", "obfuscatedId": "p-1", "metadata": {"title": "Engineer"}}]}
+    retriever = GleanPeopleProfileRetriever(server_url="https://acme-be.glean.com", api_token="test-token")
+
+    for _ in range(2):
+        docs = asyncio.run(retriever.ainvoke("jane"))
+        assert [doc.page_content for doc in docs] == ["Jane Doe\nEngineer"]
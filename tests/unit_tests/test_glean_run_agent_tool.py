@@ -17,12 +17,12 @@ class TestGleanRunAgentTool:
         os.environ["GLEAN_API_TOKEN"] = "test-api-token"
 
         # Mock the Glean class where it's used directly in the tool
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Mock the client property of the Glean instance
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
 
         # Create mock agents client
         mock_agents = MagicMock()
@@ -67,7 +67,7 @@ class TestGleanRunAgentTool:
         result = self.tool._run(agent_id=agent_id, fields=fields)
 
         # Verify that run was called with the correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.assert_called_once_with(agent_id=agent_id, input=fields)
+        self.mock_glean.return_value.client.agents.run.assert_called_once_with(agent_id=agent_id, input=fields)
 
         assert result == '{"result": "success", "output": "Mock agent response"}'
 
@@ -78,12 +78,12 @@ class TestGleanRunAgentTool:
 
         # Mock response that doesn't have model_dump_json
         mock_response = "Raw string response"
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.return_value = mock_response
+        self.mock_glean.return_value.client.agents.run.return_value = mock_response
 
         result = self.tool._run(agent_id=agent_id, fields=fields)
 
         # Verify that run was called with the correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.assert_called_once_with(agent_id=agent_id, input=fields)
+        self.mock_glean.return_value.client.agents.run.assert_called_once_with(agent_id=agent_id, input=fields)
 
         assert result == "Raw string response"
 
@@ -95,7 +95,7 @@ class TestGleanRunAgentTool:
         mock_response = MagicMock()
         mock_response.text = "Raw error response"
         error = errors.GleanError("Test error", raw_response=mock_response)
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.side_effect = error
+        self.mock_glean.return_value.client.agents.run.side_effect = error
 
         result = self.tool._run(agent_id="test-agent-id", fields={})
 
@@ -105,7 +105,7 @@ class TestGleanRunAgentTool:
     def test_run_with_generic_exception(self) -> None:
         """Test _run when a generic exception occurs."""
         # Mock generic exception
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run.side_effect = Exception("Generic error")
+        self.mock_glean.return_value.client.agents.run.side_effect = Exception("Generic error")
 
         result = self.tool._run(agent_id="test-agent-id", fields={})
 
@@ -124,7 +124,7 @@ class TestGleanRunAgentTool:
             mock_response.model_dump_json.return_value = '{"result": "success", "output": "Mock agent response"}'
             return mock_response
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         result = await self.tool._arun(agent_id=agent_id, fields=fields)
 
@@ -140,7 +140,7 @@ class TestGleanRunAgentTool:
         async def mock_run_async(*args, **kwargs):
             return "Raw string response"
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         result = await self.tool._arun(agent_id=agent_id, fields=fields)
 
@@ -160,7 +160,7 @@ class TestGleanRunAgentTool:
         async def mock_run_async(*args, **kwargs):
             raise error
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         result = await self.tool._arun(agent_id="test-agent-id", fields={})
 
@@ -175,7 +175,7 @@ class TestGleanRunAgentTool:
         async def mock_run_async(*args, **kwargs):
             raise Exception("Generic error")
 
-        self.mock_glean.return_value.__enter__.return_value.client.agents.run_async = mock_run_async
+        self.mock_glean.return_value.client.agents.run_async = mock_run_async
 
         result = await self.tool._arun(agent_id="test-agent-id", fields={})
 
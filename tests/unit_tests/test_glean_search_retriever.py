@@ -1,3 +1,4 @@
+import asyncio
 import os
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -27,28 +28,28 @@ class TestGleanSearchRetriever:
         os.environ["GLEAN_ACT_AS"] = "test@example.com"
 
         # Mock the Glean class where it's directly used
-        self.mock_glean_patcher = patch("langchain_glean._api_client_mixin.Glean")
+        self.mock_glean_patcher = patch("glean.api_client.Glean")
         self.mock_glean = self.mock_glean_patcher.start()
 
         # Create mock search client
         mock_search = MagicMock()
         mock_client = MagicMock()
-        self.mock_glean.return_value.__enter__.return_value.client = mock_client
+        self.mock_glean.return_value.client = mock_client
         mock_client.search = mock_search
 
         # Create mock sample data with SimpleNamespace for better attribute access
         self.mock_author = SimpleNamespace(name="John Doe", email="john@example.com")
 
         self.mock_doc_metadata = SimpleNamespace(
-            datasourceInstance="workspace",
-            objectType="Message",
-            mimeType="text/plain",
-            documentId="doc-123",
-            loggingId="log-123",
-            createTime="2023-01-01T00:00:00Z",
-            updateTime="2023-01-02T00:00:00Z",
+            datasource_instance="workspace",
+            object_type="Message",
+            mime_type="text/plain",
+            document_id="doc-123",
+            logging_id="log-123",
+            create_time="2023-01-01T00:00:00Z",
+            update_time="2023-01-02T00:00:00Z",
             visibility="PUBLIC_VISIBLE",
-            documentCategory="PUBLISHED_CONTENT",
+            document_category="PUBLISHED_CONTENT",
             author=self.mock_author,
         )
 
@@ -109,13 +110,24 @@ class TestGleanSearchRetriever:
         with pytest.raises(ValueError):
             GleanSearchRetriever()
 
+    def test_invoke_passes_retry_policy_per_request(self) -> None:
+        """Test that max_retry_elapsed_ms is applied to the search call itself."""
+        self.retriever.invoke("test query")
+        assert self.mock_glean.return_value.client.search.query.call_args.kwargs["retries"] is None
+
+        retriever = GleanSearchRetriever(max_retry_elapsed_ms=10_000)
+        retriever.invoke("test query")
+        retries = self.mock_glean.return_value.client.search.query.call_args.kwargs["retries"]
+        assert retries.strategy == "backoff"
+        assert retries.backoff.max_elapsed_time == 10_000
+
     def test_invoke_with_simple_query(self) -> None:
         """Test the invoke method with a simple string query."""
         docs = self.retriever.invoke("test query")
 
         # Verify the search.query method was called with the correct parameters
-        self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
-        call_args = self.mock_glean.return_value.__enter__.return_value.client.search.query.call_args
+        self.mock_glean.return_value.client.search.query.assert_called_once()
+        call_args = self.mock_glean.return_value.client.search.query.call_args
 
         # Check the unpacked kwargs (SDK 0.11+ uses individual params, not request=)
         assert call_args[1]["query"] == "test query"
@@ -134,6 +146,14 @@ class TestGleanSearchRetriever:
         assert doc.metadata["create_time"] == "2023-01-01T00:00:00Z"
         assert doc.metadata["update_time"] == "2023-01-02T00:00:00Z"
 
+    def test_retrievers_share_glean_client(self) -> None:
+        """Test that retrievers with the same credentials reuse one Glean client."""
+        self.retriever.invoke("first query")
+        GleanSearchRetriever().invoke("second query")
+
+        self.mock_glean.assert_called_once()
+        assert self.mock_glean.return_value.client.search.query.call_count == 2
+
     def test_invoke_with_basic_params(self) -> None:
         """Test the invoke method with basic additional parameters."""
         # Mock the _build_search_request method to avoid conversion issues in tests
@@ -160,11 +180,11 @@ class TestGleanSearchRetriever:
             assert kwargs["max_snippet_size"] == 100
 
             # Verify that query was called (SDK 0.11+ unpacks request into kwargs)
-            self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
+            self.mock_glean.return_value.client.search.query.assert_called_once()
 
     def test_build_document(self) -> None:
         """Test the _build_document method."""
-        result = self.mock_glean.return_value.__enter__.return_value.client.search.query.return_value.results[0]
+        result = self.mock_glean.return_value.client.search.query.return_value.results[0]
 
         doc = self.retriever._build_document(result)
 
@@ -179,6 +199,40 @@ class TestGleanSearchRetriever:
         assert doc.metadata["author"] == "John Doe"
         assert doc.metadata["create_time"] == "2023-01-01T00:00:00Z"
         assert doc.metadata["update_time"] == "2023-01-02T00:00:00Z"
+        assert doc.metadata["datasource_instance"] == "workspace"
+        assert doc.metadata["object_type"] == "Message"
+        assert doc.metadata["mime_type"] == "text/plain"
+        assert doc.metadata["document_category"] == "PUBLISHED_CONTENT"
+
+    def test_build_document_debug_info_is_opt_in(self) -> None:
+        """Test that debug_info is only copied into metadata when include_debug_info is set."""
+        result = SimpleNamespace(**vars(self.mock_result), debug_info={"score": 0.5})
+
+        assert "debug_info" not in self.retriever._build_document(result).metadata
+
+        retriever = GleanSearchRetriever(include_debug_info=True)
+        assert retriever._build_document(result).metadata["debug_info"] == "{'score': 0.5}"
+
+    def test_build_document_from_sdk_models(self) -> None:
+        """Test that metadata is read from real SDK models, which use snake_case attributes."""
+        from glean.api_client import models
+
+        result = models.SearchResult(
+            url="https://example.com/doc",
+            title="Sample Document",
+            document=models.Document(
+                id="doc-123",
+                datasource="slack",
+                metadata=models.DocumentMetadata(datasource_instance="workspace", object_type="Message", mime_type="text/plain"),
+            ),
+        )
+
+        doc = self.retriever._build_document(result)
+
+        assert doc.metadata["datasource_instance"] == "workspace"
+        assert doc.metadata["object_type"] == "Message"
+        assert doc.metadata["mime_type"] == "text/plain"
+        assert doc.metadata["doc_type"] is None
 
     # ===== ADVANCED TESTS =====
 
@@ -198,8 +252,8 @@ class TestGleanSearchRetriever:
         docs = self.retriever.invoke(search_request)
 
         # Verify the search was called with unpacked request params (SDK 0.11+)
-        self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
-        call_args = self.mock_glean.return_value.__enter__.return_value.client.search.query.call_args
+        self.mock_glean.return_value.client.search.query.assert_called_once()
+        call_args = self.mock_glean.return_value.client.search.query.call_args
         assert call_args[1]["query"] == "test query"
         assert call_args[1]["http_headers"] == {"X-Glean-ActAs": "test@example.com"}
 
@@ -216,7 +270,34 @@ class TestGleanSearchRetriever:
         _ = self.retriever.invoke("test query", page_size=20, request_options=request_options)
 
         # Verify the search call
-        self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
+        self.mock_glean.return_value.client.search.query.assert_called_once()
+
+    def test_page_size_follows_k(self):
+        """Test that only k results are requested unless page_size is given explicitly."""
+        search = self.mock_glean.return_value.client.search
+        search.query.return_value.results = [self.mock_result] * 5
+
+        assert len(self.retriever.invoke("test query", k=3)) == 3
+        assert search.query.call_args[1]["page_size"] == 3
+
+        assert len(self.retriever.invoke("test query", k=3, page_size=20)) == 3
+        assert search.query.call_args[1]["page_size"] == 20
+
+        self.retriever.invoke("test query")
+        assert search.query.call_args[1]["page_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_blank_query_skips_search(self):
+        """Test that whitespace-only queries return no documents without calling Glean."""
+        search = self.mock_glean.return_value.client.search
+
+        assert self.retriever.invoke("") == []
+        assert await self.retriever.ainvoke("   ") == []
+        assert [doc async for doc in self.retriever.astream_documents("\n")] == []
+        search.query.assert_not_called()
+
+        self.retriever.invoke("", request_options=SearchRequestOptions(facet_bucket_size=10, datasources_filter=["slack"]))
+        search.query.assert_called_once()
 
     def test_invoke_with_facet_filters(self):
         """Test invoking with strongly typed facet filters."""
@@ -234,7 +315,7 @@ class TestGleanSearchRetriever:
         _ = self.retriever.invoke("test query", request_options=request_options)
 
         # Verify the search call
-        self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
+        self.mock_glean.return_value.client.search.query.assert_called_once()
 
     async def test_ainvoke_with_native_search_request(self):
         """Test async invoking with a native SearchRequest object."""
@@ -256,7 +337,7 @@ class TestGleanSearchRetriever:
         async def mock_query_async(*args, **kwargs):
             return mock_async_results
 
-        self.mock_glean.return_value.__enter__.return_value.client.search.query_async = mock_query_async
+        self.mock_glean.return_value.client.search.query_async = mock_query_async
 
         docs = await self.retriever.ainvoke(search_request)
 
@@ -265,6 +346,63 @@ class TestGleanSearchRetriever:
         assert isinstance(docs[0], Document)
         assert docs[0].page_content == "This is a sample snippet.\nThis is another sample snippet."
 
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_request(self):
+        """Test that concurrent identical async searches issue a single Glean request."""
+        calls = []
+
+        async def mock_query_async(*args, **kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(results=[self.mock_result])
+
+        self.mock_glean.return_value.client.search.query_async = mock_query_async
+
+        first, second, other = await asyncio.gather(
+            self.retriever.ainvoke("test query"),
+            self.retriever.ainvoke("test query"),
+            self.retriever.ainvoke("other query"),
+        )
+
+        assert [call["query"] for call in calls] == ["test query", "other query"]
+        assert first == second
+        assert first[0] is not second[0]
+        assert len(other) == 1
+
+        await self.retriever.ainvoke("test query")
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesced_search_error_reported_to_each_caller(self):
+        """Test that a failed shared request is reported to every waiting caller's callbacks."""
+        from glean.api_client import errors
+        from langchain_core.callbacks import BaseCallbackHandler
+
+        class ErrorRecorder(BaseCallbackHandler):
+            def __init__(self) -> None:
+                self.errors: list = []
+
+            def on_retriever_error(self, error: BaseException, **kwargs) -> None:
+                self.errors.append(error)
+
+        calls = []
+
+        async def mock_query_async(*args, **kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0.01)
+            raise errors.GleanError("Test error", raw_response=MagicMock())
+
+        self.mock_glean.return_value.client.search.query_async = mock_query_async
+        recorders = [ErrorRecorder(), ErrorRecorder()]
+
+        results = await asyncio.gather(*(self.retriever.ainvoke("test query", config={"callbacks": [recorder]}) for recorder in recorders))
+
+        assert results == [[], []]
+        assert len(calls) == 1
+        for recorder in recorders:
+            assert len(recorder.errors) == 1
+            assert "Glean client error" in str(recorder.errors[0])
+
     def test_combining_with_limit_parameter(self):
         """Test combining k parameter with SearchRequest."""
         # Create a SearchRequest
@@ -274,4 +412,106 @@ class TestGleanSearchRetriever:
         _ = self.retriever.invoke(search_request, k=5)
 
         # Verify the search call
-        self.mock_glean.return_value.__enter__.return_value.client.search.query.assert_called_once()
+        self.mock_glean.return_value.client.search.query.assert_called_once()
+
+    def test_result_cache(self):
+        """Test that identical searches are served from the cache when it is enabled."""
+        search = self.mock_glean.return_value.client.search
+
+        # Disabled by default
+        self.retriever.invoke("test query")
+        self.retriever.invoke("test query")
+        assert search.query.call_count == 2
+
+        search.query.reset_mock()
+        retriever = GleanSearchRetriever(cache_size=1)
+        first = retriever.invoke("test query")
+        first[0].metadata["title"] = "mutated"
+        second = retriever.invoke("test query")
+        assert search.query.call_count == 1
+        assert second[0].metadata["title"] == "Sample Document"
+
+        # A different query evicts the only slot
+        retriever.invoke("other query")
+        retriever.invoke("test query")
+        assert search.query.call_count == 3
+
+    def test_result_cache_expires(self):
+        """Test that cached results are refreshed after cache_ttl seconds."""
+        search = self.mock_glean.return_value.client.search
+        retriever = GleanSearchRetriever(cache_size=8, cache_ttl=30)
+
+        with patch("langchain_glean.retrievers.search.time.monotonic", side_effect=[100.0, 110.0, 200.0, 200.0]):
+            retriever.invoke("test query")
+            retriever.invoke("test query")
+            assert search.query.call_count == 1
+
+            retriever.invoke("test query")
+            assert search.query.call_count == 2
+
+    async def test_astream_documents_follows_cursor(self):
+        """Test that astream_documents yields per result and pages until k documents are produced."""
+        first_page = SimpleNamespace(results=[self.mock_result], cursor="page-2", has_more_results=True)
+        second_page = SimpleNamespace(results=[self.mock_result, self.mock_result], cursor="page-3", has_more_results=True)
+        calls = []
+
+        async def mock_query_async(**kwargs):
+            calls.append(kwargs)
+            return first_page if len(calls) == 1 else second_page
+
+        self.mock_glean.return_value.client.search.query_async = mock_query_async
+
+        docs = [doc async for doc in self.retriever.astream_documents("test query", k=2)]
+
+        assert len(docs) == 2
+        assert all(isinstance(doc, Document) for doc in docs)
+        assert len(calls) == 2
+        assert "cursor" not in calls[0]
+        assert calls[1]["cursor"] == "page-2"
+
+    @pytest.mark.asyncio
+    async def test_invoke_with_k_zero_skips_the_request(self):
+        """Test that k=0 returns no documents from invoke and ainvoke without querying Glean."""
+        search = self.mock_glean.return_value.client.search
+
+        assert self.retriever.invoke("test query", k=0) == []
+        assert await self.retriever.ainvoke("test query", k=0) == []
+        search.query.assert_not_called()
+        search.query_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_astream_documents_with_k_zero_yields_nothing(self):
+        """Test that k=0 yields no documents without querying Glean, matching ainvoke."""
+        search = self.mock_glean.return_value.client.search
+
+        assert [doc async for doc in self.retriever.astream_documents("test query", k=0)] == []
+        search.query_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_astream_documents_skips_unconvertible_results(self, caplog):
+        """Test that a result that cannot be converted is skipped and logged instead of ending the stream."""
+        page = SimpleNamespace(results=[self.mock_result, self.mock_result], cursor=None, has_more_results=False)
+
+        async def mock_query_async(**kwargs):
+            return page
+
+        self.mock_glean.return_value.client.search.query_async = mock_query_async
+        good_doc = Document(page_content="ok")
+
+        with patch.object(self.retriever, "_build_document", side_effect=[ValueError("bad result"), good_doc]):
+            docs = [doc async for doc in self.retriever.astream_documents("test query")]
+
+        assert docs == [good_doc]
+        assert "could not be converted" in caplog.text
+
+
+def test_ainvoke_from_separate_event_loops(glean_async_api):
+    """Test that the shared client serves ainvoke calls made from different event loops."""
+    glean_async_api["/rest/api/v1/search"] = {
+        "results": [{"url": "https://example.com/doc", "title": "Doc", "snippets": [{"snippet": "", "text": "Sample snippet."}]}]
+    }
+    retriever = GleanSearchRetriever(server_url="https://acme-be.glean.com", api_token="test-token")
+
+    for _ in range(2):
+        docs = asyncio.run(retriever.ainvoke("test query"))
+        assert [doc.page_content for doc in docs] == ["Sample snippet."]
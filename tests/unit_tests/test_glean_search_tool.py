@@ -0,0 +1,55 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.documents import Document
+
+from langchain_glean.retrievers.search import GleanSearchRetriever
+from langchain_glean.tools.search import GleanSearchTool
+
+
+class TestGleanSearchTool:
+    """Test the GleanSearchTool class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up the test environment."""
+        self.mock_retriever = MagicMock(spec=GleanSearchRetriever)
+
+        self.sample_doc = Document(
+            page_content="Q2 sales grew 15%.",
+            metadata={"title": "Q2 Report", "url": "https://example.com/q2", "datasource": "gdrive"},
+        )
+
+        self.mock_retriever.invoke.return_value = [self.sample_doc]
+        self.mock_retriever.ainvoke.return_value = [self.sample_doc]
+
+        self.tool = GleanSearchTool(retriever=self.mock_retriever)
+
+        yield
+
+    def test_run_returns_text_by_default(self) -> None:
+        """Test that results are rendered as a readable listing by default."""
+        result = self.tool._run("q2 sales")
+
+        self.mock_retriever.invoke.assert_called_once_with("q2 sales")
+        assert result == "Result 1: Q2 Report (gdrive)\nURL: https://example.com/q2\nContent: Q2 sales grew 15%.\n"
+
+    def test_run_with_no_results(self) -> None:
+        """Test the message returned when nothing matches."""
+        self.mock_retriever.invoke.return_value = []
+
+        assert self.tool._run("nothing") == "No results found."
+
+    @pytest.mark.asyncio
+    async def test_arun_returns_json(self) -> None:
+        """Test that return_format="json" renders results as a JSON array."""
+        tool = GleanSearchTool(retriever=self.mock_retriever, return_format="json")
+
+        result = await tool._arun("q2 sales")
+
+        self.mock_retriever.ainvoke.assert_called_once_with("q2 sales")
+        assert json.loads(result) == [{"title": "Q2 Report", "url": "https://example.com/q2", "datasource": "gdrive", "content": "Q2 sales grew 15%."}]
+
+        self.mock_retriever.ainvoke.return_value = []
+        assert json.loads(await tool._arun("nothing")) == []
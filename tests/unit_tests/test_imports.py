@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import langchain_glean
+
+
+def test_all_exports_resolve() -> None:
+    """Every name in ``__all__`` is importable from the package root."""
+    for name in langchain_glean.__all__:
+        assert getattr(langchain_glean, name) is not None
+
+
+def test_package_import_is_lazy() -> None:
+    """Importing the package root must not pull in the Glean SDK or langchain_core."""
+    code = "import sys, langchain_glean; print('glean.api_client' in sys.modules, 'langchain_core' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+    assert out == "False False"
+
+
+def test_version_is_resolved_lazily() -> None:
+    """``__version__`` is computed on first access and cached on the module."""
+    version = langchain_glean.__version__
+    assert isinstance(version, str)
+    assert langchain_glean.__dict__["__version__"] == version
+
+
+def test_agent_chat_import_defers_sdk() -> None:
+    """``ChatGleanAgent`` only loads the Glean SDK once a request is made."""
+    code = "import sys; from langchain_glean.chat_models import ChatGleanAgent; print('glean.api_client' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+    assert out == "False"
@@ -1,6 +1,8 @@
 """Tests for server_url support in GleanAPIClientMixin."""
 
+import asyncio
 import os
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +11,11 @@ from langchain_glean._api_client_mixin import GleanAPIClientMixin
 from langchain_glean.chat_models.chat import ChatGlean
 
 
+async def _open_async_client(async_client: Any) -> None:
+    """Make the SDK's per-loop async client create its httpx client on the running loop."""
+    async_client.build_request("GET", "https://acme-be.glean.com")
+
+
 class TestServerUrl:
     """Test server_url field and _build_glean_client()."""
 
@@ -65,24 +72,156 @@ class TestServerUrl:
     def test_build_glean_client_with_server_url(self):
         """Test _build_glean_client uses server_url when set."""
         chat = ChatGlean(server_url="https://acme-be.glean.com")
-        with patch("langchain_glean._api_client_mixin.Glean") as mock_glean:
+        with patch("glean.api_client.Glean") as mock_glean:
             chat._build_glean_client()
-            mock_glean.assert_called_once_with(
-                server_url="https://acme-be.glean.com",
-                api_token="test-token",
-            )
+            mock_glean.assert_called_once()
+            kwargs = mock_glean.call_args.kwargs
+            assert kwargs["server_url"] == "https://acme-be.glean.com"
+            assert kwargs["api_token"] == "test-token"
+            assert "instance" not in kwargs
 
     def test_build_glean_client_with_instance(self):
         """Test _build_glean_client uses instance when server_url is not set."""
         chat = ChatGlean(instance="acme")
-        with patch("langchain_glean._api_client_mixin.Glean") as mock_glean:
+        with patch("glean.api_client.Glean") as mock_glean:
+            chat._build_glean_client()
+            mock_glean.assert_called_once()
+            kwargs = mock_glean.call_args.kwargs
+            assert kwargs["instance"] == "acme"
+            assert kwargs["api_token"] == "test-token"
+            assert "server_url" not in kwargs
+
+    def test_build_glean_client_uses_tuned_connection_pool(self):
+        """Test that the SDK is handed httpx clients with an enlarged keep-alive pool."""
+        chat = ChatGlean(server_url="https://acme-be.glean.com")
+        with (
+            patch("httpx.Client") as mock_client,
+            patch("httpx.AsyncClient") as mock_async_client,
+            patch("glean.api_client.Glean") as mock_glean,
+            patch("glean.api_client.httpclient.close_clients"),
+        ):
+            chat._build_glean_client()
+            asyncio.run(_open_async_client(mock_glean.call_args.kwargs["async_client"]))
+
+        for http_client in (mock_client, mock_async_client):
+            limits = http_client.call_args.kwargs["limits"]
+            assert limits.max_connections == 100
+            assert limits.max_keepalive_connections == 100
+            assert limits.keepalive_expiry == 30.0
+
+    def test_pool_maxsize(self):
+        """Test that pool_maxsize sizes the connection pool and keys the shared client."""
+        chat = ChatGlean(server_url="https://acme-be.glean.com", pool_maxsize=8)
+        with patch("httpx.Client") as mock_client, patch("glean.api_client.Glean"), patch("glean.api_client.httpclient.close_clients"):
+            chat._build_glean_client()
+        limits = mock_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 8
+
+        default = ChatGlean(server_url="https://acme-be.glean.com")
+        assert chat._get_glean_client() is not default._get_glean_client()
+
+    def test_async_client_created_lazily_per_loop(self):
+        """Test that no async httpx client is created until an event loop uses the SDK client."""
+        chat = ChatGlean(server_url="https://acme-be.glean.com")
+        with (
+            patch("httpx.AsyncClient") as mock_async_client,
+            patch("glean.api_client.Glean") as mock_glean,
+            patch("glean.api_client.httpclient.close_clients"),
+        ):
             chat._build_glean_client()
-            mock_glean.assert_called_once_with(
-                instance="acme",
-                api_token="test-token",
-            )
+            mock_async_client.assert_not_called()
+
+            async_client = mock_glean.call_args.kwargs["async_client"]
+            asyncio.run(_open_async_client(async_client))
+            asyncio.run(_open_async_client(async_client))
+        assert mock_async_client.call_count == 2
+
+    def test_retries_disabled_by_default(self):
+        """Test that no retry policy is produced unless max_retry_elapsed_ms is set."""
+        assert ChatGlean(server_url="https://acme-be.glean.com")._retry_config() is None
+
+    def test_max_retry_elapsed_ms_configures_backoff(self):
+        """Test that max_retry_elapsed_ms yields a backoff policy without enabling retries on the shared client."""
+        chat = ChatGlean(server_url="https://acme-be.glean.com", max_retry_elapsed_ms=10_000)
+        with patch("glean.api_client.Glean") as mock_glean:
+            chat._build_glean_client()
+        assert "retry_config" not in mock_glean.call_args.kwargs
+
+        retry_config = chat._retry_config()
+        assert retry_config.strategy == "backoff"
+        assert retry_config.retry_connection_errors is True
+        assert retry_config.backoff.max_elapsed_time == 10_000
+
+    def test_http2_disabled_by_default(self):
+        """Test that HTTP/2 is opt-in."""
+        chat = ChatGlean(server_url="https://acme-be.glean.com")
+        assert chat.http2 is False
+        with patch("httpx.Client") as mock_client, patch("glean.api_client.Glean"), patch("glean.api_client.httpclient.close_clients"):
+            chat._build_glean_client()
+        assert mock_client.call_args.kwargs["http2"] is False
+
+    def test_http2_passed_to_http_clients(self):
+        """Test that http2=True is forwarded to both httpx clients."""
+        with patch("langchain_glean._api_client_mixin.find_spec", return_value=object()):
+            chat = ChatGlean(server_url="https://acme-be.glean.com", http2=True)
+        with (
+            patch("httpx.Client") as mock_client,
+            patch("httpx.AsyncClient") as mock_async_client,
+            patch("glean.api_client.Glean") as mock_glean,
+            patch("glean.api_client.httpclient.close_clients"),
+        ):
+            chat._build_glean_client()
+            asyncio.run(_open_async_client(mock_glean.call_args.kwargs["async_client"]))
+        assert mock_client.call_args.kwargs["http2"] is True
+        assert mock_async_client.call_args.kwargs["http2"] is True
+
+    def test_http2_without_h2_raises_at_construction(self):
+        """Test that http2=True fails loudly when the h2 package is missing."""
+        with patch("langchain_glean._api_client_mixin.find_spec", return_value=None):
+            with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+                ChatGlean(server_url="https://acme-be.glean.com", http2=True)
+
+    def test_shared_client_works_across_event_loops(self, glean_async_api):
+        """Test that the shared client opens a fresh async pool for each event loop."""
+        glean_async_api["/rest/api/v1/search"] = {"results": [{"url": "https://example.com/doc", "title": "Doc"}]}
+        chat = ChatGlean(server_url="https://acme-be.glean.com")
+
+        async def search() -> str:
+            response = await chat._get_glean_client().client.search.query_async(query="x")
+            return response.results[0].title
+
+        assert asyncio.run(search()) == "Doc"
+        assert asyncio.run(search()) == "Doc"
 
     def test_missing_both_server_url_and_instance_raises(self):
         """Test that omitting both server_url and instance raises ValueError."""
         with pytest.raises(ValueError):
             ChatGlean()
+
+    def test_explicit_credentials_take_precedence_over_env(self):
+        """Test that explicitly passed credentials are used instead of env vars."""
+        os.environ["GLEAN_ACT_AS"] = "env@example.com"
+        chat = ChatGlean(server_url="https://acme-be.glean.com", api_token="explicit-token", act_as="me@example.com")
+        assert chat.api_token == "explicit-token"
+        assert chat.act_as == "me@example.com"
+
+    def test_explicit_empty_act_as_is_not_replaced_by_env(self):
+        """Test that an explicitly passed empty act_as is kept instead of falling back to the env var."""
+        os.environ["GLEAN_ACT_AS"] = "env@example.com"
+        chat = ChatGlean(server_url="https://acme-be.glean.com", act_as="")
+        assert chat.act_as == ""
+        assert ChatGlean(server_url="https://acme-be.glean.com").act_as == "env@example.com"
+
+    def test_empty_api_token_without_env_raises(self):
+        """Test that an explicitly empty api_token is treated as missing."""
+        os.environ.pop("GLEAN_API_TOKEN")
+        with pytest.raises(ValueError):
+            ChatGlean(server_url="https://acme-be.glean.com", api_token="")
+
+    def test_empty_credentials_fall_back_to_env(self):
+        """Test that empty instance and api_token values are resolved from the env vars."""
+        os.environ["GLEAN_INSTANCE"] = "env-instance"
+        chat = ChatGlean(instance="", api_token="")
+        assert chat.instance == "env-instance"
+        assert chat.api_token == "test-token"